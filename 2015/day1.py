@@ -33,7 +33,21 @@ For example:
 
 What is the position of the character that causes Santa to first enter the basement?
 """
+from __future__ import annotations
+
+import mmap
+import os
 from collections.abc import Generator
+from itertools import accumulate
+from operator import indexOf
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # Only needed for annotations, keeps asyncio out of the import time
+    import asyncio
+
+CHUNK_SIZE = 1 << 24  # Bytes of directions reduced by one task
+BLOCK_SIZE = 1 << 22  # Bytes per numpy block, the int64 running floors take eight times as much
+STEPS = bytes(255 if byte == ord(")") else 1 if byte == ord("(") else 0 for byte in range(256))  # 255 is -1 as a signed byte
 
 def read_char(filepath: str) -> Generator[str, None, None]:
     """
@@ -67,6 +81,177 @@ def calculate_floor_and_basement(directions: str) -> tuple[int, int | None]:
 
     return floor, basement_position
 
+def reduce_chunk(data: bytes) -> tuple[int, int]:
+    """
+    Reduce a chunk of directions to its net floor change and its lowest floor relative to its start
+
+    Chunks combine in order: a chunk starting on floor `f` ends on `f + delta` and goes no lower
+    than `f + min_prefix`, so the final floor and the chunk holding the first basement entry are
+    known without revisiting any chunk but that one
+
+    Args:
+        data (bytes): The directions, bytes other than `(` and `)` are ignored
+
+    Returns:
+        tuple[int, int]: The net floor change and the minimum running floor, 0 for an empty chunk
+    """
+    steps = memoryview(data.translate(STEPS)).cast("b")
+    return data.count(b"(") - data.count(b")"), min(accumulate(steps, initial=0))
+
+def find_crossing(data: bytes, floor: int, target: int = -1) -> int | None:
+    """
+    Find the first position in a chunk where the running floor reaches `target`
+
+    Args:
+        data (bytes): The directions
+        floor (int): The floor at the start of the chunk
+        target (int): The floor to look for
+
+    Returns:
+        int | None: The 1-based position within the chunk, None if the floor never reaches `target`
+    """
+    steps = memoryview(data.translate(STEPS)).cast("b")
+    try:
+        return indexOf(accumulate(steps, initial=floor), target)  # Index 0 is the starting floor itself
+    except ValueError:
+        return None
+
+def read_chunk(filename: str, offset: int, length: int) -> bytes:
+    """
+    Read a chunk of a file through a memory map
+
+    Args:
+        filename (str): The input file
+        offset (int): The first byte of the chunk
+        length (int): The number of bytes in the chunk
+
+    Returns:
+        bytes: The bytes of the chunk
+    """
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return view[offset:offset + length]
+
+def reduce_file_chunk(filename: str, offset: int, length: int) -> tuple[int, int]:
+    """
+    Reduce one chunk of a file, run inside a worker process
+
+    Args:
+        filename (str): The input file
+        offset (int): The first byte of the chunk
+        length (int): The number of bytes in the chunk
+
+    Returns:
+        tuple[int, int]: The net floor change and the minimum running floor of the chunk
+    """
+    return reduce_chunk(read_chunk(filename, offset, length))
+
+def parallel_floor_and_basement(filename: str, chunk_size: int = CHUNK_SIZE, workers: int | None = None) -> tuple[int, int | None]:
+    """
+    Calculate the final floor and the first basement entry by reducing chunks of a file in parallel
+
+    Args:
+        filename (str): The input file
+        chunk_size (int): The number of bytes reduced by one task
+        workers (int | None): The number of worker processes, default is the CPU count
+
+    Returns:
+        tuple[int, int | None]: A tuple containing the final floor and the position of the first basement entry
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    size = os.path.getsize(filename)
+    offsets = range(0, size, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        reductions = executor.map(reduce_file_chunk, [filename] * len(offsets), offsets, [chunk_size] * len(offsets))
+
+        floor, basement_position = 0, None
+        for offset, (delta, min_prefix) in zip(offsets, reductions):
+            if basement_position is None and floor + min_prefix <= -1:
+                # Steps are +-1, so this is the chunk where the floor first reaches -1
+                position = find_crossing(read_chunk(filename, offset, chunk_size), floor)
+                assert position is not None
+                basement_position = offset + position
+            floor += delta
+
+    return floor, basement_position
+
+def numpy_floor_and_basement(filename: str, block_size: int = BLOCK_SIZE) -> tuple[int, int | None]:
+    """
+    Calculate the final floor and the first basement entry with numpy, one block of the file at a time
+
+    Each block is mapped to +1/-1 steps through a lookup table and summed cumulatively on top of
+    the floor carried over from the previous block, so memory stays bounded by the block size
+
+    Args:
+        filename (str): The input file
+        block_size (int): The number of bytes processed per block
+
+    Returns:
+        tuple[int, int | None]: A tuple containing the final floor and the position of the first basement entry
+    """
+    import numpy as np
+
+    steps = np.frombuffer(STEPS, dtype=np.int8)
+    floor, basement_position, offset = 0, None, 0
+
+    with open(filename, "rb") as file:
+        while data := file.read(block_size):
+            block = steps[np.frombuffer(data, dtype=np.uint8)]
+            if basement_position is None:
+                floors = np.cumsum(block, dtype=np.int64)
+                floors += floor
+                below = floors <= -1  # Steps are +-1, so the first floor below 0 is exactly -1
+                if (index := int(below.argmax())) or below[0]:
+                    basement_position = offset + index + 1
+            floor += int(block.sum(dtype=np.int64))
+            offset += len(data)
+
+    return floor, basement_position
+
+class FloorTracker:
+    """
+    Tracks the floor of a direction stream that arrives in chunks
+
+    Every chunk is reduced once with `reduce_chunk`, and only the chunk in which the floor first
+    reaches -1 is scanned for the exact position, so the floor, the number of directions seen and
+    the first basement position are plain attributes that can be read at any time
+    """
+    def __init__(self) -> None:
+        self.floor = 0
+        self.position = 0  # Bytes fed so far
+        self.basement_position: int | None = None
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Apply the next chunk of directions
+
+        Args:
+            chunk (bytes): The directions, bytes other than `(` and `)` are ignored
+        """
+        delta, min_prefix = reduce_chunk(chunk)
+        if self.basement_position is None and self.floor + min_prefix <= -1:
+            crossing = find_crossing(chunk, self.floor)
+            assert crossing is not None
+            self.basement_position = self.position + crossing
+        self.floor += delta
+        self.position += len(chunk)
+
+    async def consume(self, reader: asyncio.StreamReader, chunk_size: int = 1 << 16) -> tuple[int, int | None]:
+        """
+        Feed every chunk from a stream until it ends
+
+        Args:
+            reader (asyncio.StreamReader): The stream, e.g. from `asyncio.open_connection`
+            chunk_size (int): The maximum number of bytes read at a time
+
+        Returns:
+            tuple[int, int | None]: A tuple containing the final floor and the position of the first basement entry
+        """
+        while chunk := await reader.read(chunk_size):
+            self.feed(chunk)
+        return self.floor, self.basement_position
+
 def main():
     """
     Main function to read input and calculate results for Day 1 of Advent of Code 2015
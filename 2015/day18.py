@@ -127,9 +127,13 @@ After 5 steps, this example now has 17 lights on.
 
 In your grid of 100x100 lights, given your initial configuration, but with the four corners always in the on state, how many lights are on after 100 steps?
 """
-from typing import cast
-import numpy as np
-from numpy.typing import NDArray
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:  # numpy is only imported by the numpy_* functions
+    import numpy as np
+    from numpy.typing import NDArray
 
 def parse_data(filename: str) -> list[list[int]]:
     """
@@ -273,6 +277,20 @@ def count_lights_on(grid: list[list[int]]) -> int:
     return total
     # return sum(sum(row) for row in grid)
 
+def python_run(filename: str, steps: int) -> tuple[int, int]:
+    """
+    Run the simulation with lists for `steps` iterations and returns the count of lights on
+
+    Args:
+        filename (str): The name of the input file
+        steps (int): The number of steps to simulate
+
+    Returns:
+        tuple[int, int]: The number of lights on without and with the corners pinned
+    """
+    grid = parse_data2(filename)
+    return count_lights_on(run_simulation(grid, steps)), count_lights_on(run_simulation(grid, steps, True))
+
 def numpy_count(grid: NDArray[np.uint8]) -> NDArray[np.uint8]:
     """
     Return an array with the number of on neighbours for each cell
@@ -283,6 +301,8 @@ def numpy_count(grid: NDArray[np.uint8]) -> NDArray[np.uint8]:
     Returns:
         NDArray[np.uint8]: A numpy array with the count of neighbours that are on
     """
+    import numpy as np
+
     pad = np.pad(grid, 1)  # zero-padd all around
     return (
         pad[0:-2, 0:-2] + pad[0:-2, 1:-1] + pad[0:-2, 2:] +
@@ -301,9 +321,11 @@ def numpy_step(grid: NDArray[np.uint8], pin_corners: bool = False) -> NDArray[np
     Returns:
         NDArray[np.uint8]: The next state of the grid after applying the rules
     """
+    import numpy as np
+
     n = numpy_count(grid)
-    stay_on = cast(NDArray[np.bool], (grid == 1) & ((n == 2) | (n == 3)))
-    turn_on = cast(NDArray[np.bool], (grid == 0) & (n == 3))
+    stay_on = cast("NDArray[np.bool]", (grid == 1) & ((n == 2) | (n == 3)))
+    turn_on = cast("NDArray[np.bool]", (grid == 0) & (n == 3))
     next_grid = (stay_on | turn_on).astype(np.uint8)
 
     if pin_corners:
@@ -323,6 +345,8 @@ def numpy_run(filename: str, steps: int) -> tuple[int, int]:
     Returns:
         int: The total number of lights that are on after `steps` iterations
     """
+    import numpy as np
+
     # grid = np.array([[c == "#" for c in line.strip()] for line in open(filename, "r", encoding="utf-8")], np.uint8)
     bool_grid: list[list[bool]] = []
     with open(filename, "r", encoding="utf-8") as file:
@@ -354,8 +378,8 @@ def main():
     # print(f"Part 1: {count_lights_on(run_simulation(initial_grid, steps_to_run))}")
     # print(f"Part 2: {count_lights_on(run_simulation(initial_grid, steps_to_run, True))}")
 
-    print(f"Part 1 (numpy): {numpy_run(filename, steps_to_run)[0]}")
-    print(f"Part 2 (numpy): {numpy_run(filename, steps_to_run)[1]}")
+    print(f"Part 1: {numpy_run(filename, steps_to_run)[0]}")
+    print(f"Part 2: {numpy_run(filename, steps_to_run)[1]}")
 
 if __name__ == "__main__":
     main()
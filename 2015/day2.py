@@ -25,6 +25,24 @@ For example:
 
 How many total feet of ribbon should they order?
 """
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # numpy and the process pool are only imported by the functions using them
+    from concurrent.futures import Future
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+SEPARATORS = bytes.maketrans(b"x", b" ")  # Turns "LxWxH" lines into whitespace separated integers
+BLOCK_SIZE = 1 << 22  # Bytes read per streaming block
+CHUNK_BOXES = 1 << 18  # Boxes widened to int64 at a time by columnar_totals
+
 def get_dimensions(filepath: str) -> list[list[int]]:
     """
     Read and parse dimensions from a file
@@ -75,6 +93,149 @@ def calculate_ribbon(dimensions: list[int]) -> int:
     length, width, height = sorted(dimensions)
     return 2 * (length + width) + (length * width * height)
 
+def parse_columns(filepath: str, block_size: int = BLOCK_SIZE) -> NDArray[np.uint16]:
+    """
+    Parse every box of a file into a compact (N, 3) array, one block of lines at a time
+
+    Dimensions are stored as uint16, six bytes per box. A first pass counts the boxes by their
+    "x" separators so the array is allocated once at its final size, then each block is parsed
+    straight into its rows. Only one block of text and its int64 values are held at a time
+
+    Args:
+        filepath (str): The filepath to read dimensions from
+        block_size (int): The number of bytes parsed at a time
+
+    Returns:
+        NDArray[np.uint16]: One row of (length, width, height) per present
+
+    Raises:
+        ValueError: If a dimension does not fit in 16 bits or a line does not hold three dimensions
+    """
+    import numpy as np
+
+    boxes = sum(block.count(b"x") for block in read_blocks(filepath, block_size)) // 2
+    columns = np.empty(boxes * 3, dtype=np.uint16)
+    offset = 0
+    for block in read_blocks(filepath, block_size):
+        values = np.fromstring(block.translate(SEPARATORS), dtype=np.int64, sep=" ")
+        if values.size and not 0 <= values.min() <= values.max() <= np.iinfo(np.uint16).max:
+            raise ValueError(f"Dimensions of {filepath} do not fit in 16 bits")
+        if offset + values.size > columns.size:
+            raise ValueError(f"{filepath} holds lines that are not LxWxH")
+        columns[offset:offset + values.size] = values
+        offset += values.size
+    if offset != columns.size:
+        raise ValueError(f"{filepath} holds lines that are not LxWxH")
+    return columns.reshape(-1, 3)
+
+def columnar_totals(dimensions: NDArray[np.unsignedinteger], chunk_size: int = CHUNK_BOXES) -> tuple[int, int]:
+    """
+    Calculate the total wrapping paper and ribbon for every present with array operations
+    Formula, with the sides sorted so that a <= b <= c:
+        - Paper = 2ab + 2bc + 2ca + ab
+        - Ribbon = 2 * (a + b) + abc
+
+    Products overflow narrow dtypes, so each chunk of boxes is widened to int64 on its own and
+    the temporaries stay bounded by the chunk size
+
+    Args:
+        dimensions (NDArray[np.unsignedinteger]): One row of (length, width, height) per present, sorted in place
+        chunk_size (int): The number of boxes widened at a time
+
+    Returns:
+        tuple[int, int]: The total square feet of wrapping paper and the total feet of ribbon
+    """
+    import numpy as np
+
+    dimensions.sort(axis=1)
+    paper = ribbon = 0
+    for start in range(0, len(dimensions), chunk_size):
+        a, b, c = dimensions[start:start + chunk_size].astype(np.int64).T  # Column views, dot products sum without temporaries
+        paper += 3 * int(a @ b) + 2 * int(b @ c) + 2 * int(c @ a)
+        ribbon += 2 * (int(a.sum()) + int(b.sum())) + int((a * b) @ c)
+    return paper, ribbon
+
+def read_blocks(filepath: str, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Read a file in blocks that end on a line boundary
+
+    Args:
+        filepath (str): The filepath to read
+        block_size (int): The number of bytes read at a time
+
+    Yields:
+        Iterator[bytes]: Blocks of whole lines, the partial line at the end of a read is carried into the next block
+    """
+    carry = b""
+    with open(filepath, "rb") as file:
+        while data := file.read(block_size):
+            data = carry + data
+            cut = data.rfind(b"\n") + 1
+            if cut:
+                carry = data[cut:]
+                yield data[:cut]
+            else:  # A single line longer than the block, keep reading
+                carry = data
+    if carry.strip():
+        yield carry
+
+def block_totals(block: bytes) -> tuple[int, int]:
+    """
+    Calculate the wrapping paper and ribbon for every present in a block of whole lines
+
+    Args:
+        block (bytes): Lines of "LxWxH" dimensions
+
+    Returns:
+        tuple[int, int]: The square feet of wrapping paper and the feet of ribbon for the block
+    """
+    values = list(map(int, block.translate(SEPARATORS).split()))
+    paper = ribbon = 0
+    for dimensions in zip(values[0::3], values[1::3], values[2::3]):
+        a, b, c = sorted(dimensions)
+        paper += 3 * a * b + 2 * c * (a + b)
+        ribbon += 2 * (a + b) + a * b * c
+    return paper, ribbon
+
+def stream_totals(filepath: str, block_size: int = BLOCK_SIZE, workers: int = 0) -> tuple[int, int, float]:
+    """
+    Total the wrapping paper and ribbon of a file in constant memory
+
+    Only a few blocks are in flight at once, so memory is bounded by the block size whatever
+    the size of the file
+
+    Args:
+        filepath (str): The filepath to read dimensions from
+        block_size (int): The number of bytes read at a time
+        workers (int): The number of worker processes, 0 totals the blocks in this process
+
+    Returns:
+        tuple[int, int, float]: The total square feet of wrapping paper, the total feet of ribbon and the throughput in MB/s
+    """
+    start = time.perf_counter()
+    paper = ribbon = 0
+
+    if workers == 0:
+        for block in read_blocks(filepath, block_size):
+            block_paper, block_ribbon = block_totals(block)
+            paper, ribbon = paper + block_paper, ribbon + block_ribbon
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: deque[Future[tuple[int, int]]] = deque()
+            for block in read_blocks(filepath, block_size):
+                if len(pending) >= 2 * workers:  # Keep every worker busy without reading ahead
+                    block_paper, block_ribbon = pending.popleft().result()
+                    paper, ribbon = paper + block_paper, ribbon + block_ribbon
+                pending.append(executor.submit(block_totals, block))
+            for future in pending:
+                block_paper, block_ribbon = future.result()
+                paper, ribbon = paper + block_paper, ribbon + block_ribbon
+
+    elapsed = time.perf_counter() - start
+    return paper, ribbon, os.path.getsize(filepath) / 1e6 / max(elapsed, 1e-9)
+
 def main():
     """
     Main function to read dimensions from a file and calculate total wrapping paper and ribbon needed
@@ -26,6 +26,97 @@ For example:
 
 This year, how many houses receive at least one present?
 """
+MOVES = {"^": (0, 1), "v": (0, -1), ">": (1, 0), "<": (-1, 0)}
+# Byte lookup tables of the x and y steps, 255 is -1 as a signed byte and other bytes do not move
+DX = bytes(MOVES.get(chr(byte), (0, 0))[0] % 256 for byte in range(256))
+DY = bytes(MOVES.get(chr(byte), (0, 0))[1] % 256 for byte in range(256))
+
+class VisitedGrid:
+    """
+    A set of visited cells stored as a dense bitmap over a rectangular bounding box
+
+    Each cell costs one bit instead of a tuple in a hash set. When a cell falls outside the box
+    the width or the height doubles until it fits and the old bitmap is copied into the middle
+    of the new one, so walkers wandering off in any direction keep the box roughly centred on
+    the start, and a walk along one axis only grows that axis
+    """
+    def __init__(self, width: int = 64, height: int = 64) -> None:
+        # A power of two of at least 16 keeps rows whole bytes and makes every horizontal
+        # re-centring shift, half the difference between two such widths, a multiple of 8 bits
+        self.width = 1 << (max(16, width) - 1).bit_length()
+        self.height = max(1, height)
+        self.x_offset = self.width // 2  # Cell (x, y) is stored at column x + x_offset, row y + y_offset
+        self.y_offset = self.height // 2
+        self.bits = bytearray(self.width * self.height // 8)
+        self.count = 0
+
+    def _grow(self, x: int, y: int) -> None:
+        """
+        Double the width and the height of the bounding box until it holds (x, y), keeping the old cells centred
+
+        Args:
+            x (int): The x coordinate that has to fit
+            y (int): The y coordinate that has to fit
+        """
+        width, x_offset = self.width, self.x_offset
+        while not 0 <= x + x_offset < width:
+            width *= 2
+            x_offset = width // 2 - (self.width // 2 - self.x_offset)
+        height, y_offset = self.height, self.y_offset
+        while not 0 <= y + y_offset < height:
+            height *= 2
+            y_offset = height // 2 - (self.height // 2 - self.y_offset)
+        x_shift = x_offset - self.x_offset  # A multiple of 8 because both widths are powers of two of at least 16
+        y_shift = y_offset - self.y_offset
+        row_bytes, new_row_bytes = self.width // 8, width // 8
+
+        bits = bytearray(width * height // 8)
+        for row in range(self.height):
+            start = (row + y_shift) * new_row_bytes + x_shift // 8
+            bits[start:start + row_bytes] = self.bits[row * row_bytes:(row + 1) * row_bytes]
+        self.width, self.height, self.x_offset, self.y_offset, self.bits = width, height, x_offset, y_offset, bits
+
+    def add(self, x: int, y: int) -> bool:
+        """
+        Mark a cell as visited
+
+        Args:
+            x (int): The x coordinate of the cell
+            y (int): The y coordinate of the cell
+
+        Returns:
+            bool: True if the cell had not been visited before
+        """
+        column, row = x + self.x_offset, y + self.y_offset
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            self._grow(x, y)
+            column, row = x + self.x_offset, y + self.y_offset
+        index = row * self.width + column
+        mask = 1 << (index & 7)
+        if self.bits[index >> 3] & mask:
+            return False
+        self.bits[index >> 3] |= mask
+        self.count += 1
+        return True
+
+    def __contains__(self, cell: tuple[int, int]) -> bool:
+        column, row = cell[0] + self.x_offset, cell[1] + self.y_offset
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            return False
+        index = row * self.width + column
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def popcount(self) -> int:
+        """
+        Count the visited cells from the bitmap itself
+
+        Returns:
+            int: The number of set bits
+        """
+        return int.from_bytes(self.bits, "little").bit_count()
 
 def count_houses(directions: str, number_deliverers: int = 1) -> int:
     """
@@ -54,6 +145,59 @@ def count_houses(directions: str, number_deliverers: int = 1) -> int:
         visited_houses.add(positions[mover])
     return len(visited_houses)
 
+def count_houses_bitmap(directions: str, number_deliverers: int = 1) -> int:
+    """
+    Calculate the number of unique houses visited, tracking them in a bitmap
+
+    Args:
+        directions (str): A string of directions consisting of characters `^`, `v`, `>`, `<`
+        number_deliverers (int): The number of deliverers taking turns
+
+    Returns:
+        int: The number of unique houses that received at least one present
+    """
+    xs, ys = [0] * number_deliverers, [0] * number_deliverers
+    visited = VisitedGrid()
+    visited.add(0, 0)
+
+    for i, direction in enumerate(directions):
+        mover = i % number_deliverers
+        x, y = MOVES.get(direction, (0, 0))
+        xs[mover] += x
+        ys[mover] += y
+        visited.add(xs[mover], ys[mover])
+    return len(visited)
+
+def numpy_count_houses(directions: str, number_deliverers: int = 1) -> int:
+    """
+    Calculate the number of unique houses visited with numpy
+
+    Each deliverer takes every `number_deliverers`-th direction, so its moves are a strided
+    slice whose cumulative sum is its trajectory. Positions are packed as `x * 2**32 + y` into
+    one int64 key, which is exact while coordinates stay within 2**31 of the start
+
+    Args:
+        directions (str): A string of directions consisting of characters `^`, `v`, `>`, `<`
+        number_deliverers (int): The number of deliverers taking turns
+
+    Returns:
+        int: The number of unique houses that received at least one present
+    """
+    import numpy as np
+
+    data = np.frombuffer(directions.encode(), dtype=np.uint8)
+    dx = np.frombuffer(DX, dtype=np.int8)[data]
+    dy = np.frombuffer(DY, dtype=np.int8)[data]
+
+    keys = [np.zeros(1, dtype=np.int64)]  # The starting house
+    for deliverer in range(number_deliverers):
+        x = np.cumsum(dx[deliverer::number_deliverers], dtype=np.int64)
+        y = np.cumsum(dy[deliverer::number_deliverers], dtype=np.int64)
+        x <<= 32
+        x += y
+        keys.append(x)
+    return len(np.unique(np.concatenate(keys)))
+
 def main():
     """
     Main function to read input and calculate the number of unique houses visited
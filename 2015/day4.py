@@ -16,7 +16,24 @@ Your puzzle input is yzbqklnj.
 
 Now find one that starts with six zeroes.
 """
+from __future__ import annotations
+
 import hashlib
+import os
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # The process pool is only imported by the parallel miner
+    from concurrent.futures import Future
+    from multiprocessing.sharedctypes import Synchronized
+
+CHUNK_SIZE = 100_000  # Nonces per task handed to a worker
+CHECK_INTERVAL = 4096  # Nonces between checks of the shared lowest hit
+NO_HIT = 1 << 62
+SMALL_NONCES = [b"%d" % low for low in range(1000)]  # The bytes of nonces below 1000
+LOW_DIGITS = [b"%03d" % low for low in range(1000)]  # The last three digits of larger nonces
+LOWEST_HIT: Synchronized[int] | None = None  # The lowest confirmed hit, shared by the miner's worker processes
 
 def find_adventcoin(secret_key: str, leading_zeros: int) -> tuple[int, str]:
     """
@@ -38,16 +55,226 @@ def find_adventcoin(secret_key: str, leading_zeros: int) -> tuple[int, str]:
             return number, my_hash
         number += 1
 
+def first_hit(secret_key: str, leading_zeros: int, start: int, stop: int) -> int | None:
+    """
+    Find the lowest nonce in a range whose hash starts with the leading zeros, without building hex strings
+
+    The MD5 state after the secret key, and after the leading digits of each thousand nonces, is
+    computed once and copied, so each nonce only hashes its last three digits. The zero test
+    compares whole zero bytes of the raw digest and checks the high nibble of the next byte
+    for an odd number of zeros
+
+    Args:
+        secret_key (str): The secret key to use for hashing
+        leading_zeros (int): The number of leading zeros the hash must start with
+        start (int): The first nonce to try
+        stop (int): The nonce after the last one to try
+
+    Returns:
+        int | None: The lowest matching nonce, None if the range holds none
+    """
+    base = hashlib.md5(secret_key.encode())
+    zero_bytes, odd = divmod(leading_zeros, 2)
+    zeros = bytes(zero_bytes)
+
+    for high in range(start // 1000, (stop - 1) // 1000 + 1):
+        if high:
+            state = base.copy()
+            state.update(b"%d" % high)
+            suffixes = LOW_DIGITS
+        else:
+            state, suffixes = base, SMALL_NONCES
+        low_start = max(start - high * 1000, 0)
+        for low, suffix in enumerate(suffixes[low_start:min(stop - high * 1000, 1000)], low_start):
+            candidate = state.copy()
+            candidate.update(suffix)
+            digest = candidate.digest()
+            if digest.startswith(zeros) and (not odd or digest[zero_bytes] < 16):
+                return high * 1000 + low
+    return None
+
+def fast_adventcoin(secret_key: str, leading_zeros: int) -> tuple[int, str]:
+    """
+    Search for the lowest AdventCoin with the reused hash states of `first_hit`
+
+    Args:
+        secret_key (str): The secret key to use for hashing
+        leading_zeros (int): The number of leading zeros the hash must start with
+
+    Returns:
+        tuple[int, str]: A tuple containing the lowest number and the corresponding hash
+    """
+    start = 1
+    while (number := first_hit(secret_key, leading_zeros, start, start + CHUNK_SIZE)) is None:
+        start += CHUNK_SIZE
+    return number, hashlib.md5(f"{secret_key}{number}".encode()).hexdigest()
+
+def leading_zero_nibbles(digest: bytes) -> int:
+    """
+    Count the leading zero hex digits of a raw digest
+
+    Args:
+        digest (bytes): The raw digest
+
+    Returns:
+        int: The number of leading zeros of its hexdigest
+    """
+    count = 0
+    for byte in digest:
+        if byte:
+            return count + (byte < 16)
+        count += 2
+    return count
+
+def find_adventcoins(targets: Iterable[tuple[str, int]]) -> dict[tuple[str, int], tuple[int, str]]:
+    """
+    Search for the lowest AdventCoin of several (secret key, leading zeros) targets in a single sweep
+
+    Every key hashes each nonce once and the hit is checked against all of that key's remaining
+    difficulties, so the five-zero answer is found on the way to the six-zero one. A key drops
+    out of the sweep once all its targets are met
+
+    Args:
+        targets (Iterable[tuple[str, int]]): The secret keys and numbers of leading zeros to find
+
+    Returns:
+        dict[tuple[str, int], tuple[int, str]]: The lowest number and its hash for each target
+    """
+    pending: dict[str, set[int]] = {}
+    for secret_key, leading_zeros in targets:
+        pending.setdefault(secret_key, set()).add(leading_zeros)
+    bases = {secret_key: hashlib.md5(secret_key.encode()) for secret_key in pending}
+    found: dict[tuple[str, int], tuple[int, str]] = {}
+
+    high = 0
+    while pending:
+        for secret_key in list(pending):
+            difficulties = pending[secret_key]
+            zero_bytes, odd = divmod(min(difficulties), 2)
+            zeros = bytes(zero_bytes)
+            if high:
+                state = bases[secret_key].copy()
+                state.update(b"%d" % high)
+                suffixes = LOW_DIGITS
+            else:
+                state, suffixes = bases[secret_key], SMALL_NONCES
+
+            for low, suffix in enumerate(suffixes):
+                candidate = state.copy()
+                candidate.update(suffix)
+                digest = candidate.digest()
+                if not digest.startswith(zeros) or (odd and digest[zero_bytes] >= 16) or (high == 0 and low == 0):
+                    continue
+                count = leading_zero_nibbles(digest)
+                for leading_zeros in [difficulty for difficulty in difficulties if difficulty <= count]:
+                    found[(secret_key, leading_zeros)] = (high * 1000 + low, digest.hex())
+                    difficulties.remove(leading_zeros)
+                if not difficulties:
+                    del pending[secret_key]
+                    break
+                zero_bytes, odd = divmod(min(difficulties), 2)
+                zeros = bytes(zero_bytes)
+        high += 1
+    return found
+
+def init_miner(lowest_hit: Synchronized[int]) -> None:
+    """
+    Store the shared lowest hit in a miner worker process
+
+    Args:
+        lowest_hit (Synchronized[int]): The lowest nonce found so far by any worker
+    """
+    global LOWEST_HIT  # pylint: disable=global-statement
+    LOWEST_HIT = lowest_hit
+
+def search_range(secret_key: str, leading_zeros: int, start: int, stop: int) -> tuple[tuple[int, str] | None, int]:
+    """
+    Search a contiguous range of nonces for the lowest AdventCoin
+
+    Inside a miner worker the search gives up as soon as another worker has confirmed a hit
+    below `start`, since nothing in this range can be the lowest any more
+
+    Args:
+        secret_key (str): The secret key to use for hashing
+        leading_zeros (int): The number of leading zeros the hash must start with
+        start (int): The first nonce to try
+        stop (int): The nonce after the last one to try
+
+    Returns:
+        tuple[tuple[int, str] | None, int]: The lowest number and its hash if the range holds one, and the number of hashes computed
+    """
+    for block_start in range(start, stop, CHECK_INTERVAL):
+        if LOWEST_HIT is not None and LOWEST_HIT.value < start:
+            return None, block_start - start
+        if (number := first_hit(secret_key, leading_zeros, block_start, min(block_start + CHECK_INTERVAL, stop))) is not None:
+            if LOWEST_HIT is not None:
+                with LOWEST_HIT.get_lock():
+                    LOWEST_HIT.value = min(LOWEST_HIT.value, number)
+            return (number, hashlib.md5(f"{secret_key}{number}".encode()).hexdigest()), number - start + 1
+    return None, stop - start
+
+def parallel_adventcoin(secret_key: str, leading_zeros: int, chunk_size: int = CHUNK_SIZE, workers: int | None = None) -> tuple[int, str, float]:
+    """
+    Search for the lowest AdventCoin with worker processes mining contiguous ranges of nonces
+
+    Ranges are handed out in increasing order. Once a hit is confirmed, ranges above it are
+    cancelled or abandoned, while every range below it still runs to completion, so the result
+    is the same lowest number `find_adventcoin` returns
+
+    Args:
+        secret_key (str): The secret key to use for hashing
+        leading_zeros (int): The number of leading zeros the hash must start with
+        chunk_size (int): The number of nonces per task
+        workers (int | None): The number of worker processes, default is the CPU count
+
+    Returns:
+        tuple[int, str, float]: The lowest number, its hash and the hashes computed per second
+    """
+    import multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    workers = workers or os.cpu_count() or 1
+    lowest_hit = multiprocessing.Value("q", NO_HIT)
+    best_number: int | None = None
+    best_hash = ""
+    hashes, next_start = 0, 1
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(workers, initializer=init_miner, initargs=(lowest_hit,)) as executor:
+        pending: dict[Future[tuple[tuple[int, str] | None, int]], int] = {}
+        while True:
+            while best_number is None and len(pending) < 2 * workers:  # Keep every worker busy
+                pending[executor.submit(search_range, secret_key, leading_zeros, next_start, next_start + chunk_size)] = next_start
+                next_start += chunk_size
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                hit, count = future.result()
+                hashes += count
+                if hit is not None and (best_number is None or hit[0] < best_number):
+                    best_number, best_hash = hit
+            if best_number is not None:
+                for future, range_start in list(pending.items()):
+                    if range_start > best_number and future.cancel():
+                        del pending[future]
+
+    assert best_number is not None
+    return best_number, best_hash, hashes / (time.perf_counter() - start)
+
 def main():
     """
     Main function to find the AdventCoin for the given secret key with specified leading zeros
     """
     secret_key = "yzbqklnj"
+    coins = find_adventcoins([(secret_key, 5), (secret_key, 6)])  # One sweep finds both
 
-    num, my_hash = find_adventcoin(secret_key, 5)
+    num, my_hash = coins[(secret_key, 5)]
     print(f"Part 1: number = {num}, hash = {my_hash}")
 
-    num, my_hash = find_adventcoin(secret_key, 6)
+    num, my_hash = coins[(secret_key, 6)]
     print(f"Part 2: number = {num}, hash = {my_hash}")
 
 if __name__ == "__main__":
@@ -37,7 +37,27 @@ For example:
 
 How many strings are nice under these new rules?
 """
+from __future__ import annotations
+
+import os
 import re
+import time
+from collections import Counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # numpy is only imported by the batch classifier
+    import numpy as np
+    from numpy.typing import NDArray
+
+VOWELS = b"aeiou"
+DISALLOWED = (b"ab", b"cd", b"pq", b"xy")
+VOWEL_CODES = frozenset(VOWELS)
+DISALLOWED_CODES = frozenset(first << 8 | second for first, second in DISALLOWED)  # Pairs as integer codes
+RULES = ("three_vowels", "double_letter", "no_disallowed", "pair_twice", "repeat_with_gap")
+THREE_VOWELS, DOUBLE_LETTER, NO_DISALLOWED, PAIR_TWICE, REPEAT_WITH_GAP = (1 << bit for bit in range(len(RULES)))
+PART1_RULES = THREE_VOWELS | DOUBLE_LETTER | NO_DISALLOWED
+PART2_RULES = PAIR_TWICE | REPEAT_WITH_GAP
+SHARD_SIZE = 1 << 24  # Bytes of lines counted by one worker task
 
 def is_nice(word: str) -> bool:
     """
@@ -189,6 +209,214 @@ def is_nice_two_simple(word: str) -> bool:
     has_repeat_with_gap = any(word[i] == word[i+2] for i in range(len(word) - 2))
     return has_pair_twice and has_repeat_with_gap
 
+def scan_word(word: bytes) -> tuple[bool, bool, int]:
+    """
+    Check a word against both rule sets in a single pass
+
+    All five rules are updated together from each letter and the pair code it forms with the
+    previous letter. Vowels and doubles stop being tracked once a disallowed pair rules part 1
+    out, part 2 once both of its rules hold, and the scan ends early when both outcomes are settled
+
+    Args:
+        word (bytes): The word to check, without its line ending
+
+    Returns:
+        tuple[bool, bool, int]: Whether the word is nice under the original and the new rules, and a mask with bit i set when the word failed `RULES[i]`, rules left unchecked by an early exit are not set
+    """
+    vowels = 0
+    double_letter = disallowed = pair_twice = repeat_with_gap = False
+    first_seen: dict[int, int] = {}
+    previous = before = -1
+
+    for i, char in enumerate(word):
+        code = previous << 8 | char
+        if not disallowed:
+            if code in DISALLOWED_CODES:
+                disallowed = True
+            else:
+                if char in VOWEL_CODES:
+                    vowels += 1
+                if char == previous:
+                    double_letter = True
+        if not (pair_twice and repeat_with_gap):
+            if char == before:
+                repeat_with_gap = True
+            if not pair_twice and i and i - first_seen.setdefault(code, i) > 1:  # Pairs one apart overlap
+                pair_twice = True
+        elif disallowed:
+            break  # Both outcomes are settled
+        before, previous = previous, char
+
+    if disallowed:
+        failed = NO_DISALLOWED
+    else:
+        failed = (vowels < 3) * THREE_VOWELS | (not double_letter) * DOUBLE_LETTER
+    failed |= (not pair_twice) * PAIR_TWICE | (not repeat_with_gap) * REPEAT_WITH_GAP
+    return not failed & PART1_RULES, not failed & PART2_RULES, failed
+
+def stream_nice_counts(filename: str) -> tuple[int, int, Counter[str]]:
+    """
+    Count nice words line by line with the single-pass scanner, in constant memory
+
+    Args:
+        filename (str): The input file with one word per line
+
+    Returns:
+        tuple[int, int, Counter[str]]: The number of nice words under the original and the new rules, and how many words failed each rule
+    """
+    count = count2 = 0
+    masks: Counter[int] = Counter()
+    with open(filename, "rb") as file:
+        for line in file:
+            nice, nice_two, failed = scan_word(line.rstrip())
+            count += nice
+            count2 += nice_two
+            masks[failed] += 1
+
+    rejections: Counter[str] = Counter()
+    for failed, words in masks.items():
+        for bit, rule in enumerate(RULES):
+            if failed >> bit & 1:
+                rejections[rule] += words
+    return count, count2, rejections
+
+def shard_offsets(filename: str, shard_size: int = SHARD_SIZE) -> list[tuple[int, int]]:
+    """
+    Split a file into byte ranges that start and end on line boundaries
+
+    Args:
+        filename (str): The input file
+        shard_size (int): The approximate number of bytes per range
+
+    Returns:
+        list[tuple[int, int]]: The start and stop offset of each range
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as file:
+        while boundaries[-1] + shard_size < size:
+            file.seek(boundaries[-1] + shard_size)
+            file.readline()  # Move on to the start of the next line
+            if file.tell() >= size:
+                break
+            boundaries.append(file.tell())
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+def count_shard(filename: str, start: int, stop: int, rules: tuple[str, str]) -> tuple[int, int]:
+    """
+    Count the nice words of one byte range of a file, run inside a worker process
+
+    Args:
+        filename (str): The input file
+        start (int): The offset of the first line
+        stop (int): The offset after the last line
+        rules (tuple[str, str]): The names of the part 1 and part 2 rule functions e.g. ("is_nice_regex", "is_nice_two_regex")
+
+    Returns:
+        tuple[int, int]: The number of nice words under each rule
+    """
+    rule, rule_two = globals()[rules[0]], globals()[rules[1]]
+    with open(filename, "rb") as file:
+        file.seek(start)
+        lines = file.read(stop - start).decode().splitlines()
+    return sum(map(rule, lines)), sum(map(rule_two, lines))
+
+def sharded_counts(filename: str, rules: tuple[str, str] = ("is_nice", "is_nice_two"), shard_size: int = SHARD_SIZE,
+                   workers: int | None = None, report: bool = False) -> tuple[int, int]:
+    """
+    Count nice words by running the chosen rules over line-aligned shards in worker processes
+
+    Args:
+        filename (str): The input file with one word per line
+        rules (tuple[str, str]): The names of the part 1 and part 2 rule functions
+        shard_size (int): The approximate number of bytes per shard
+        workers (int | None): The number of worker processes, default is the CPU count
+        report (bool): Print the shard size, worker count and timing
+
+    Returns:
+        tuple[int, int]: The number of nice words under the original and the new rules
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    shards = shard_offsets(filename, shard_size)
+    count = count2 = 0
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(count_shard, filename, shard_start, shard_stop, rules) for shard_start, shard_stop in shards]
+        for future in futures:
+            nice, nice_two = future.result()
+            count, count2 = count + nice, count2 + nice_two
+
+    if report:
+        elapsed = time.perf_counter() - start
+        print(f"{len(shards)} shards of {shard_size} bytes on {workers} workers with {'/'.join(rules)}: {elapsed:.3f}s")
+    return count, count2
+
+def count_nice_matrix(words: NDArray[np.uint8]) -> tuple[int, int]:
+    """
+    Count the nice words of both rule sets for a matrix of equal-length words
+
+    Every rule is a comparison between shifted columns: letters with their neighbour, letters
+    two apart, and two-letter pair codes with the pair codes at least two positions further on
+
+    Args:
+        words (NDArray[np.uint8]): One word per row, all of the same length
+
+    Returns:
+        tuple[int, int]: The number of nice words under the original and the new rules
+    """
+    import numpy as np
+
+    vowel_table = np.zeros(256, dtype=bool)
+    vowel_table[list(VOWELS)] = True
+    pairs = (words[:, :-1].astype(np.uint16) << 8) | words[:, 1:]  # Each two-letter pair as one code
+
+    has_three_vowels = vowel_table[words].sum(axis=1) >= 3
+    has_double_letter = (words[:, 1:] == words[:, :-1]).any(axis=1)
+    has_disallowed = np.isin(pairs, [first << 8 | second for first, second in DISALLOWED]).any(axis=1)
+    part1 = int((has_three_vowels & has_double_letter & ~has_disallowed).sum())
+
+    has_repeat_with_gap = (words[:, 2:] == words[:, :-2]).any(axis=1)
+    has_pair_twice = np.zeros(len(words), dtype=bool)
+    for distance in range(2, pairs.shape[1]):  # Pairs at least two apart do not overlap
+        has_pair_twice |= (pairs[:, distance:] == pairs[:, :-distance]).any(axis=1)
+    part2 = int((has_pair_twice & has_repeat_with_gap).sum())
+    return part1, part2
+
+def count_nice_batch(filename: str) -> tuple[int, int]:
+    """
+    Count the nice words of a file with the matrix classifier
+
+    Words are grouped by length, so a file of fixed-width words is a single (N, width) matrix
+    and variable-length words cost one matrix per distinct length
+
+    Args:
+        filename (str): The input file with one word per line
+
+    Returns:
+        tuple[int, int]: The number of nice words under the original and the new rules
+    """
+    import numpy as np
+
+    with open(filename, "rb") as file:
+        words = file.read().split()
+
+    by_length: dict[int, list[bytes]] = {}
+    if words and all(len(word) == len(words[0]) for word in words):
+        by_length[len(words[0])] = words
+    else:
+        for word in words:
+            by_length.setdefault(len(word), []).append(word)
+
+    part1 = part2 = 0
+    for length, group in by_length.items():
+        matrix = np.frombuffer(b"".join(group), dtype=np.uint8).reshape(-1, length)
+        nice, nice_two = count_nice_matrix(matrix)
+        part1, part2 = part1 + nice, part2 + nice_two
+    return part1, part2
+
 def main():
     """
     Main function to read the input file and count nice strings
@@ -37,9 +37,16 @@ For example:
     toggle 0,0 through 999,999 would increase the total brightness by 2000000.
 
 """
+from __future__ import annotations
+
 import re
-import numpy as np
-from numpy.typing import NDArray
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # numpy is only imported when the grids are built
+    import numpy as np
+    from numpy.typing import NDArray
+
+DELTAS = {"turn on": 1, "turn off": -1, "toggle": 2}  # Brightness change of each command in part 2
 
 def parse_instruction(instruction: str) -> tuple[str, slice, slice]:
     """
@@ -59,6 +66,19 @@ def parse_instruction(instruction: str) -> tuple[str, slice, slice]:
     command, x0, y0, x1, y1 = match.groups()
     return command, slice(int(x0), int(x1) + 1), slice(int(y0), int(y1) + 1)
 
+def parse_instructions(filename: str) -> list[tuple[str, slice, slice]]:
+    """
+    Parses every lighting instruction in a file
+
+    Args:
+        filename (str): The name of the input file
+
+    Returns:
+        list[tuple[str, slice, slice]]: A list of commands with their x and y coordinate slices
+    """
+    with open(filename, "r", encoding="utf-8") as file:
+        return [parse_instruction(line) for line in file if line.strip()]
+
 def apply_part1(grid: NDArray[np.bool], command: str, x_slice: slice, y_slice: slice) -> None:
     """
     Applies a light command to a boolean grid where each cell is either on or off
@@ -91,6 +111,8 @@ def apply_part2(grid: NDArray[np.integer], command: str, x_slice: slice, y_slice
         x_slice (slice): Slice object for row indexing
         y_slice (slice): Slice object for column indexing
     """
+    import numpy as np
+
     # if command == 'turn on':
     #     grid[x_slice, y_slice] += 1
     # elif command == 'turn off':
@@ -98,14 +120,65 @@ def apply_part2(grid: NDArray[np.integer], command: str, x_slice: slice, y_slice
     #     grid[grid < 0] = 0  # Clamp to 0
     # elif command == 'toggle':
     #     grid[x_slice, y_slice] += 2
-    delta_map = {
-        "turn on": 1,
-        "turn off": -1,
-        "toggle": 2
-    }
-    grid[x_slice, y_slice] += delta_map[command]
-    # np.maximum(grid, 0, out=grid)  # Ensure no negative values remain
-    grid[grid < 0] = 0  # Ensure no negative brightness values
+    region = grid[x_slice, y_slice]  # A view, updating it updates the grid
+    region += DELTAS[command]
+    if command == "turn off":  # Only a decrease can go negative, and only inside the region
+        np.maximum(region, 0, out=region)
+
+def dense_totals(instructions: list[tuple[str, slice, slice]], side: int = 1000) -> tuple[int, int]:
+    """
+    Applies every instruction to dense grids holding one cell per light
+
+    Args:
+        instructions (list[tuple[str, slice, slice]]): The commands with their x and y coordinate slices
+        side (int): The number of lights along each side of the grid
+
+    Returns:
+        tuple[int, int]: The number of lights lit and the total brightness
+    """
+    import numpy as np
+
+    grid_part1 = np.zeros((side, side), dtype=bool)
+    grid_part2 = np.zeros((side, side), dtype=int)
+
+    for command, x_slice, y_slice in instructions:
+        apply_part1(grid_part1, command, x_slice, y_slice)
+        apply_part2(grid_part2, command, x_slice, y_slice)
+    return int(np.sum(grid_part1)), int(np.sum(grid_part2))
+
+def compressed_totals(instructions: list[tuple[str, slice, slice]]) -> tuple[int, int]:
+    """
+    Applies every instruction to grids of compressed cells, whatever the size of the light grid
+
+    The distinct rectangle boundaries split each axis into intervals that every instruction
+    either covers completely or not at all, so each compressed cell stands for a block of lights
+    that always share a state. The cells are weighted by the area of their block when summing
+
+    Args:
+        instructions (list[tuple[str, slice, slice]]): The commands with their x and y coordinate slices
+
+    Returns:
+        tuple[int, int]: The number of lights lit and the total brightness
+    """
+    import numpy as np
+
+    xs = sorted({bound for _, x_slice, _ in instructions for bound in (x_slice.start, x_slice.stop)})
+    ys = sorted({bound for _, _, y_slice in instructions for bound in (y_slice.start, y_slice.stop)})
+    x_index = {x: i for i, x in enumerate(xs)}
+    y_index = {y: i for i, y in enumerate(ys)}
+
+    grid_part1 = np.zeros((max(len(xs) - 1, 0), max(len(ys) - 1, 0)), dtype=bool)
+    grid_part2 = np.zeros(grid_part1.shape, dtype=np.int64)
+
+    for command, x_slice, y_slice in instructions:
+        cells_x = slice(x_index[x_slice.start], x_index[x_slice.stop])
+        cells_y = slice(y_index[y_slice.start], y_index[y_slice.stop])
+        apply_part1(grid_part1, command, cells_x, cells_y)
+        apply_part2(grid_part2, command, cells_x, cells_y)
+
+    widths = np.diff(np.array(xs, dtype=np.int64))
+    heights = np.diff(np.array(ys, dtype=np.int64))
+    return int(widths @ grid_part1.astype(np.int64) @ heights), int(widths @ grid_part2 @ heights)
 
 def main():
     """
@@ -113,17 +186,9 @@ def main():
     """
     filename = "day6.txt"
 
-    grid_part1 = np.zeros((1000, 1000), dtype=bool)
-    grid_part2 = np.zeros((1000, 1000), dtype=int)
-
-    with open(filename, "r", encoding="utf-8") as file:
-        for line in file:
-            command, x_slice, y_slice = parse_instruction(line)
-            apply_part1(grid_part1, command, x_slice, y_slice)
-            apply_part2(grid_part2, command, x_slice, y_slice)
-
-    print(f"Part 1: {np.sum(grid_part1)}")
-    print(f"Part 2: {np.sum(grid_part2)}")
+    part1, part2 = dense_totals(parse_instructions(filename))
+    print(f"Part 1: {part1}")
+    print(f"Part 2: {part2}")
 
 if __name__ == "__main__":
     main()
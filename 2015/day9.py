@@ -137,6 +137,33 @@ def held_karp(cities: list[str], distances: dict[str, dict[str, int]], find_min:
     final_dists = [dp[(full_mask, j)] for j in range(n)]
     return int(min(final_dists)) if find_min else int(max(final_dists))
 
+def route_extremes(cities: list[str], distances: dict[str, dict[str, int]]) -> tuple[int, int]:
+    """
+    Finds the shortest and longest routes by checking every permutation
+
+    Args:
+        cities (list[str]): list of city names
+        distances (dict[str, dict[str, int]]): A dictionary mapping city pairs to their distances
+
+    Returns:
+        tuple[int, int]: The shortest and longest route distances
+    """
+    route_distances = calculate_route_distances(cities, distances)
+    return min(route_distances), max(route_distances)
+
+def held_karp_extremes(cities: list[str], distances: dict[str, dict[str, int]]) -> tuple[int, int]:
+    """
+    Finds the shortest and longest routes with Held-Karp
+
+    Args:
+        cities (list[str]): list of city names
+        distances (dict[str, dict[str, int]]): A dictionary mapping city pairs to their distances
+
+    Returns:
+        tuple[int, int]: The shortest and longest route distances
+    """
+    return held_karp(cities, distances), held_karp(cities, distances, False)
+
 def main():
     """
     Main function to execute the solution for Day 9 of Advent of Code 2015
@@ -145,10 +172,10 @@ def main():
 
     start = time.perf_counter()
     cities, destination = parse_input_file(filename)
-    route_distances = calculate_route_distances(cities, destination)
+    shortest, longest = route_extremes(cities, destination)
 
-    print(f"Part 1: {min(route_distances)}")
-    print(f"Part 2: {max(route_distances)}")
+    print(f"Part 1: {shortest}")
+    print(f"Part 2: {longest}")
     brute_time = time.perf_counter() - start
 
     start = time.perf_counter()
@@ -27,10 +27,6 @@ For example, if your instructions are R8, R4, R4, R8, the first location you vis
 
 How many blocks away is the first location you visit twice?
 """
-from tqdm import tqdm
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.animation import PillowWriter
 
 def parse_data(filename: str) -> list[tuple[str, int]]:
     """
@@ -98,6 +94,12 @@ def animate_path(directions: list[tuple[str, int]], save_as_gif: bool = False, g
     Returns:
         None
     """
+    # Plotting and progress bars are only needed here, importing them is most of the startup time
+    import matplotlib.pyplot as plt
+    from matplotlib import animation
+    from matplotlib.animation import PillowWriter
+    from tqdm import tqdm
+
     x, y = 0, 0
     direction_index = 0
     direction_map = [(0, 1), (1, 0), (0, -1), (-1, 0)]
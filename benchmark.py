@@ -0,0 +1,459 @@
+"""
+Benchmark the competing implementations that live side by side in the solver modules
+
+Every benchmark registers a set of variants that solve the same problem on the same input.
+The harness checks that all variants agree, then reports the median and p95 wall time, the
+speedup over the slowest variant and the peak traced allocation of a single call.
+
+Usage:
+    python benchmark.py                   # every registered benchmark
+    python benchmark.py day5 day15        # only benchmarks whose name contains a filter
+    python benchmark.py --repeat 20
+    python benchmark.py --record          # store the results in the benchmark history
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from generate import GENERATORS
+from history import Result, percentile_95, record_run
+from solvers import ROOT, load_module, resolve_input
+
+Variants = dict[str, Callable[..., Any]]
+BenchmarkFactory = Callable[[], tuple[tuple[Any, ...], Variants]]
+BENCHMARKS: dict[str, BenchmarkFactory] = {}
+
+@dataclass
+class VariantStats:
+    """
+    Represents the measurements taken for one variant of a benchmark
+    """
+    name: str
+    median: float
+    p95: float
+    peak_bytes: int
+    result: Any
+    timings: list[float]
+
+def register(name: str) -> Callable[[BenchmarkFactory], BenchmarkFactory]:
+    """
+    Register a benchmark factory under the given name
+
+    A factory loads whatever it needs and returns the shared arguments plus a mapping of
+    variant names to callables. It is only invoked when the benchmark runs, so a missing
+    optional dependency only skips that one benchmark
+
+    Args:
+        name (str): The benchmark name e.g. "2015/day5 part1"
+
+    Returns:
+        Callable[[BenchmarkFactory], BenchmarkFactory]: A decorator that registers the factory
+    """
+    def decorator(factory: BenchmarkFactory) -> BenchmarkFactory:
+        BENCHMARKS[name] = factory
+        return factory
+    return decorator
+
+def solver(name: str) -> Any:
+    """
+    Load a solver module by its short name e.g. "2015/day5"
+
+    Args:
+        name (str): The year directory and module name joined by a slash
+
+    Returns:
+        Any: The imported solver module
+    """
+    return load_module(ROOT / f"{name}.py")
+
+def read_lines(name: str, filename: str) -> list[str]:
+    """
+    Read an input file that lives next to a solver module
+
+    Args:
+        name (str): The solver short name e.g. "2015/day5"
+        filename (str): The input filename e.g. "day5.txt"
+
+    Returns:
+        list[str]: The lines of the file
+    """
+    path = resolve_input(ROOT / f"{name}.py", filename)
+    with open(path, "r", encoding="utf-8") as file:
+        return file.readlines()
+
+@register("2015/day2")
+def day2() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Total the paper and ribbon per box and with the columnar numpy engine
+    """
+    day2_module = solver("2015/day2")
+    filename = str(resolve_input(ROOT / "2015/day2.py", "day2.txt"))
+
+    def per_box(filename: str) -> tuple[int, int]:
+        dimensions = day2_module.get_dimensions(filename)
+        paper = sum(day2_module.calculate_wrapping_paper(dim) for dim in dimensions)
+        ribbon = sum(day2_module.calculate_ribbon(dim) for dim in dimensions)
+        return paper, ribbon
+
+    return (filename,), {
+        "per_box": per_box,
+        "columnar_totals": lambda filename: day2_module.columnar_totals(day2_module.parse_columns(filename)),
+    }
+
+@register("2015/day3")
+def day3() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Count the houses visited by one and two deliverers with a set of tuples, a bitmap and numpy
+    """
+    day3_module = solver("2015/day3")
+    directions = "".join(read_lines("2015/day3", "day3.txt"))
+    return (directions,), {
+        name: lambda directions, count=count: (count(directions), count(directions, 2))
+        for name, count in (
+            ("count_houses", day3_module.count_houses),
+            ("count_houses_bitmap", day3_module.count_houses_bitmap),
+            ("numpy_count_houses", day3_module.numpy_count_houses),
+        )
+    }
+
+@register("2015/day4")
+def day4() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Mine the five-zero AdventCoin with the hexdigest loop and with reused hash states
+    """
+    day4_module = solver("2015/day4")
+    return ("yzbqklnj", 5), {
+        "find_adventcoin": day4_module.find_adventcoin,
+        "fast_adventcoin": day4_module.fast_adventcoin,
+    }
+
+@register("2015/day5 part1")
+def day5_part1() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Count part 1 nice strings with each rule implementation
+    """
+    day5 = solver("2015/day5")
+    lines = read_lines("2015/day5", "day5.txt")
+    return (lines,), {
+        name: lambda words, rule=rule: sum(1 for word in words if rule(word))
+        for name, rule in (("is_nice", day5.is_nice), ("is_nice_regex", day5.is_nice_regex), ("is_nice_simple", day5.is_nice_simple))
+    }
+
+@register("2015/day5 part2")
+def day5_part2() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Count part 2 nice strings with each rule implementation
+    """
+    day5 = solver("2015/day5")
+    lines = read_lines("2015/day5", "day5.txt")
+    return (lines,), {
+        name: lambda words, rule=rule: sum(1 for word in words if rule(word))
+        for name, rule in (("is_nice_two", day5.is_nice_two), ("is_nice_two_regex", day5.is_nice_two_regex), ("is_nice_two_simple", day5.is_nice_two_simple))
+    }
+
+@register("2015/day5 both parts")
+def day5_both() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Count nice strings of both parts with the regex rules, the single-pass scanner and the byte-matrix classifier
+    """
+    day5 = solver("2015/day5")
+    filename = str(resolve_input(ROOT / "2015/day5.py", "day5.txt"))
+
+    def per_line(filename: str) -> tuple[int, int]:
+        with open(filename, "r", encoding="utf-8") as file:
+            lines = file.readlines()
+        return sum(map(day5.is_nice_regex, lines)), sum(map(day5.is_nice_two_regex, lines))
+
+    return (filename,), {
+        "per_line": per_line,
+        "stream_nice_counts": lambda filename: day5.stream_nice_counts(filename)[:2],
+        "count_nice_batch": day5.count_nice_batch,
+    }
+
+@register("2015/day6")
+def day6() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Apply the lighting instructions to dense grids and to grids of compressed cells
+    """
+    day6_module = solver("2015/day6")
+    instructions = day6_module.parse_instructions(resolve_input(ROOT / "2015/day6.py", "day6.txt"))
+    return (instructions,), {
+        "dense_totals": day6_module.dense_totals,
+        "compressed_totals": day6_module.compressed_totals,
+    }
+
+def day6_part2_variants(day6_module: Any) -> Variants:
+    """
+    Build the part 2 kernels of day6, each returning the total brightness of a fresh 1000x1000 grid
+
+    Args:
+        day6_module (Any): The imported day6 solver module
+
+    Returns:
+        Variants: The kernels by name
+    """
+    import numpy as np
+
+    def per_instruction(apply: Callable[..., None]) -> Callable[[list[tuple[str, slice, slice]]], int]:
+        def run(instructions: list[tuple[str, slice, slice]]) -> int:
+            grid = np.zeros((1000, 1000), dtype=int)
+            for command, x_slice, y_slice in instructions:
+                apply(grid, command, x_slice, y_slice)
+            return int(grid.sum())
+        return run
+
+    def clamp_everything(grid: Any, command: str, x_slice: slice, y_slice: slice) -> None:
+        grid[x_slice, y_slice] += day6_module.DELTAS[command]
+        grid[grid < 0] = 0
+
+    return {"full_grid_clamp": per_instruction(clamp_everything), "apply_part2": per_instruction(day6_module.apply_part2)}
+
+@register("2015/day6 part2")
+def day6_part2() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Apply the part 2 instructions with whole-grid clamping and region-local clamping
+    """
+    day6_module = solver("2015/day6")
+    instructions = day6_module.parse_instructions(resolve_input(ROOT / "2015/day6.py", "day6.txt"))
+    return (instructions,), day6_part2_variants(day6_module)
+
+@register("2015/day6 part2 5k")
+def day6_part2_synthetic() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Apply 5,000 synthetic part 2 instructions with whole-grid clamping and region-local clamping
+
+    The whole-grid clamp costs about 0.4 ms per instruction, so 100,000 instructions would take
+    about 40 s per call. 5,000 keeps both variants comparable within a default run, and both
+    grow linearly with the number of instructions
+    """
+    day6_module = solver("2015/day6")
+    lines = "".join(GENERATORS["day6"](5_000, random.Random(0))).splitlines()
+    instructions = [day6_module.parse_instruction(line) for line in lines]
+    return (instructions,), day6_part2_variants(day6_module)
+
+@register("2015/day9")
+def day9() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Find the shortest and longest routes by brute force and with Held-Karp
+    """
+    day9_module = solver("2015/day9")
+    cities, distances = day9_module.parse_input_file(resolve_input(ROOT / "2015/day9.py", "day9.txt"))
+
+    def brute_force(cities: list[str], distances: dict[str, dict[str, int]]) -> tuple[int, int]:
+        route_distances = day9_module.calculate_route_distances(cities, distances)
+        return min(route_distances), max(route_distances)
+
+    def held_karp(cities: list[str], distances: dict[str, dict[str, int]]) -> tuple[int, int]:
+        return day9_module.held_karp(cities, distances), day9_module.held_karp(cities, distances, False)
+
+    return (cities, distances), {"brute_force": brute_force, "held_karp": held_karp}
+
+@register("2015/day14 part2")
+def day14() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Score the reindeer race with both point counting implementations
+    """
+    day14_module = solver("2015/day14")
+    race_data = day14_module.parse_data(resolve_input(ROOT / "2015/day14.py", "day14.txt"), 2503)
+    return (race_data,), {
+        "calculate_points": day14_module.calculate_points,
+        "calculate_max_points": day14_module.calculate_max_points,
+    }
+
+@register("2015/day15 generators")
+def day15() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Enumerate ingredient amounts with each composition generator
+    """
+    day15_module = solver("2015/day15")
+    total_amount = 30  # generate_products visits (total + 1) ** 4 candidates, keep it small
+
+    def enumerate_with(generator: Callable[[int, int], Any]) -> Callable[[int, int], list[tuple[int, ...]]]:
+        return lambda count, total: sorted(generator(count, total))
+
+    return (4, total_amount), {
+        "generate_combinations": enumerate_with(day15_module.generate_combinations),
+        "generate_products": enumerate_with(day15_module.generate_products),
+        "recursive_generate": enumerate_with(day15_module.recursive_generate),
+    }
+
+@register("2015/day18")
+def day18() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Run the light simulation with both list parsers and with numpy
+    """
+    day18_module = solver("2015/day18")
+    filename = str(resolve_input(ROOT / "2015/day18.py", "day18.txt"))
+    steps = 10  # The pure-Python simulation is too slow for the full 100 steps on every repeat
+
+    def pure_python(filename: str, steps: int, parser: Callable[[str], list[list[int]]]) -> tuple[int, int]:
+        grid = parser(filename)
+        part1 = day18_module.count_lights_on(day18_module.run_simulation(grid, steps))
+        part2 = day18_module.count_lights_on(day18_module.run_simulation(grid, steps, True))
+        return part1, part2
+
+    def numpy_run(filename: str, steps: int) -> tuple[int, int]:
+        part1, part2 = day18_module.numpy_run(filename, steps)
+        return int(part1), int(part2)
+
+    return (filename, steps), {
+        "parse_data": lambda filename, steps: pure_python(filename, steps, day18_module.parse_data),
+        "parse_data2": lambda filename, steps: pure_python(filename, steps, day18_module.parse_data2),
+        "numpy_run": numpy_run,
+    }
+
+@register("2015/day20 part1")
+def day20() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Find the lowest house with the bounded search and the growing sieve
+    """
+    day20_module = solver("2015/day20")
+    target = 1_000_000  # The real puzzle target takes seconds per call
+    return (target,), {
+        "lowest_house_part1": lambda target: day20_module.lowest_house_part1(target, target // 10),
+        "sieve_part1": day20_module.sieve_part1,
+    }
+
+@register("2015/day22")
+def day22() -> tuple[tuple[Any, ...], Variants]:
+    """
+    Find the least mana to win with the dict and dataclass simulations
+    """
+    day22_module = solver("2015/day22")
+    day22_class = solver("2015/day22_class")
+    return (55, 8), {
+        "day22": lambda hp, damage: (day22_module.run_simulation(hp, damage), day22_module.run_simulation(hp, damage, True)),
+        "day22_class": lambda hp, damage: (
+            int(day22_class.find_min_mana_to_win(hp, damage)),
+            int(day22_class.find_min_mana_to_win(hp, damage, True)),
+        ),
+    }
+
+def time_variant(func: Callable[..., Any], args: tuple[Any, ...], repeat: int) -> list[float]:
+    """
+    Time repeated calls of a variant
+
+    Args:
+        func (Callable[..., Any]): The variant to call
+        args (tuple[Any, ...]): The arguments to call it with
+        repeat (int): The number of timed calls
+
+    Returns:
+        list[float]: The wall time of each call in seconds
+    """
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def measure_variant(name: str, func: Callable[..., Any], args: tuple[Any, ...], repeat: int) -> VariantStats:
+    """
+    Measure one variant: a traced call for allocations and the result, then untraced timings
+
+    Args:
+        name (str): The variant name
+        func (Callable[..., Any]): The variant to call
+        args (tuple[Any, ...]): The arguments to call it with
+        repeat (int): The number of timed calls
+
+    Returns:
+        VariantStats: The collected measurements
+    """
+    tracemalloc.start()
+    result = func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = time_variant(func, args, repeat)
+    return VariantStats(name, statistics.median(timings), percentile_95(timings), peak, result, timings)
+
+def run_benchmark(name: str, repeat: int) -> list[VariantStats]:
+    """
+    Run every variant of a registered benchmark
+
+    Args:
+        name (str): The registered benchmark name
+        repeat (int): The number of timed calls per variant
+
+    Returns:
+        list[VariantStats]: The measurements for each variant, fastest first
+    """
+    args, variants = BENCHMARKS[name]()
+    stats = [measure_variant(variant, func, args, repeat) for variant, func in variants.items()]
+    return sorted(stats, key=lambda stat: stat.median)
+
+def print_report(name: str, stats: list[VariantStats]) -> bool:
+    """
+    Print the measurements of a benchmark and whether its variants agree
+
+    Args:
+        name (str): The benchmark name
+        stats (list[VariantStats]): The measurements for each variant, fastest first
+
+    Returns:
+        bool: True if every variant returned the same result
+    """
+    expected = stats[0].result
+    agree = all(stat.result == expected for stat in stats)
+    print(f"== {name} ({'variants agree' if agree else 'VARIANTS DISAGREE'})")
+    slowest = max(stat.median for stat in stats)
+    print(f"   {'variant':<24} {'median (ms)':>12} {'p95 (ms)':>10} {'speedup':>8} {'peak (KiB)':>11}  result")
+    for stat in stats:
+        marker = " " if stat.result == expected else "!"
+        result = repr(stat.result)
+        if len(result) > 30:
+            result = result[:27] + "..."
+        print(f" {marker} {stat.name:<24} {stat.median * 1000:>12.3f} {stat.p95 * 1000:>10.3f} {slowest / stat.median:>7.2f}x {stat.peak_bytes / 1024:>11.1f}  {result}")
+    return agree
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the benchmark harness
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Benchmark alternate solver implementations")
+    parser.add_argument("filters", nargs="*", help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--repeat", type=int, default=5, help="timed calls per variant")
+    parser.add_argument("--record", action="store_true", help="store the results in the benchmark history")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to run the selected benchmarks and print their reports, exits with 1 if any variants disagree
+    """
+    args = parse_args()
+    names = [name for name in BENCHMARKS if not args.filters or any(f in name for f in args.filters)]
+    results: list[Result] = []
+    disagreements: list[str] = []
+
+    for name in names:
+        try:
+            stats = run_benchmark(name, args.repeat)
+        except ImportError as exc:
+            print(f"== {name} (skipped: {exc})")
+            continue
+        if not print_report(name, stats):
+            disagreements.append(name)
+        results.extend(Result(name, stat.name, 0, stat.timings, stat.peak_bytes) for stat in stats)
+
+    if args.record and results:
+        print(f"Recorded run {record_run(results)}")
+    if disagreements:
+        print(f"Variants disagree in: {', '.join(disagreements)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
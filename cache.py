@@ -0,0 +1,195 @@
+"""
+Content-addressed on-disk cache of parsed puzzle inputs
+
+A parser result is stored under a key made from the bytes of the input file, the parser's
+name, the source code of its module and any extra arguments, so editing either the input or
+the parser and the helpers it calls invalidates the entry automatically. Entries are written with marshal when the result only
+holds builtin types, as .npy when it is a numpy array and with pickle otherwise.
+
+Usage:
+    python runner.py --cache              # solvers parse through the cache
+    python cache.py                       # show the cache size
+    python cache.py --clear
+"""
+import argparse
+import functools
+import hashlib
+import inspect
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from solvers import ROOT
+
+CACHE_DIR = ROOT / ".cache" / "parsed"
+
+# File parsers of each solver, the first argument of every one of them is the input path
+PARSERS: dict[str, list[str]] = {
+    "2015/day2": ["get_dimensions"],
+    "2015/day6": ["parse_instructions"],
+    "2015/day7": ["parse_instructions"],
+    "2015/day9": ["parse_input_file"],
+    "2015/day13": ["parse_input"],
+    "2015/day14": ["parse_data"],
+    "2015/day15": ["parse_data"],
+    "2015/day16": ["parse_input"],
+    "2015/day17": ["parse_data"],
+    "2015/day18": ["parse_data", "parse_data2"],
+    "2015/day19": ["parse_data", "parse_data2"],
+    "2015/day23": ["parse_data"],
+    "2015/day24": ["parse_data"],
+    "2016/day1": ["parse_data"],
+}
+
+def cache_key(filename: str | Path, source: str, args: tuple[Any, ...]) -> str:
+    """
+    Hash an input file together with the parser source and extra arguments
+
+    Args:
+        filename (str | Path): The input file
+        source (str): The parser name and the source code of its module
+        args (tuple[Any, ...]): Any further arguments passed to the parser
+
+    Returns:
+        str: The hex digest identifying the parsed result
+    """
+    digest = hashlib.sha256()
+    with open(filename, "rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    digest.update(source.encode())
+    digest.update(repr(args).encode())
+    return digest.hexdigest()
+
+def load_entry(key: str) -> tuple[bool, Any]:
+    """
+    Load a cached result by key, whichever format it was stored in
+
+    Args:
+        key (str): The cache key
+
+    Returns:
+        tuple[bool, Any]: Whether the entry exists and the loaded result
+    """
+    for path in CACHE_DIR.glob(f"{key}.*"):
+        if path.suffix == ".marshal":
+            return True, marshal.loads(path.read_bytes())
+        if path.suffix == ".pickle":
+            return True, pickle.loads(path.read_bytes())
+        if path.suffix == ".npy":
+            import numpy as np
+            return True, np.load(path)
+    return False, None
+
+def store_entry(key: str, result: Any) -> None:
+    """
+    Store a result in the most compact format that can represent it
+
+    The entry is written to a temporary file and renamed into place, so parallel workers
+    never see a partially written entry
+
+    Args:
+        key (str): The cache key
+        result (Any): The parsed result to store
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    numpy = sys.modules.get("numpy")
+    data: bytes | None = None  # Arrays are streamed to the file by numpy instead
+
+    if numpy is not None and isinstance(result, numpy.ndarray):
+        suffix = ".npy"
+    else:
+        try:
+            data = marshal.dumps(result)
+            suffix = ".marshal"
+        except ValueError:  # marshal only supports builtin types, not e.g. defaultdict or slice
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            suffix = ".pickle"
+
+    fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR)
+    with os.fdopen(fd, "wb") as file:
+        if data is None:
+            numpy.save(file, result)
+        else:
+            file.write(data)
+    os.replace(temp_path, CACHE_DIR / f"{key}{suffix}")
+
+def cached(parser: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a file parser so its result is cached on disk
+
+    The key covers the source of the parser's whole module, so editing a helper the parser
+    calls, or a constant it reads, invalidates its entries as well
+
+    Args:
+        parser (Callable[..., Any]): A parser whose first argument is the input path
+
+    Returns:
+        Callable[..., Any]: The caching parser
+    """
+    source = f"{parser.__qualname__}\n{Path(inspect.getfile(parser)).read_text(encoding='utf-8')}"
+
+    @functools.wraps(parser)
+    def wrapper(filename: str, *args: Any) -> Any:
+        key = cache_key(filename, source, args)
+        found, result = load_entry(key)
+        if not found:
+            result = parser(filename, *args)
+            store_entry(key, result)
+        return result
+    return wrapper
+
+def install(module: ModuleType, name: str) -> None:
+    """
+    Replace the file parsers of a solver module with caching versions
+
+    `main()` looks its parsers up as module globals on every call, so swapping the module
+    attribute is enough to route it through the cache
+
+    Args:
+        module (ModuleType): The imported solver module
+        name (str): The solver short name e.g. "2015/day7"
+    """
+    for parser_name in PARSERS.get(name, []):
+        parser = getattr(module, parser_name)
+        if not hasattr(parser, "__wrapped__"):
+            setattr(module, parser_name, cached(parser))
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the cache tool
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Inspect or clear the parsed input cache")
+    parser.add_argument("--clear", action="store_true", help="delete every cached entry")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to report the size of the cache or clear it
+    """
+    args = parse_args()
+    entries = list(CACHE_DIR.glob("*")) if CACHE_DIR.exists() else []
+
+    if args.clear:
+        for path in entries:
+            path.unlink()
+        print(f"Removed {len(entries)} entries from {CACHE_DIR}")
+        return
+
+    total = sum(path.stat().st_size for path in entries)
+    print(f"{len(entries)} entries, {total / 1024:.1f} KiB in {CACHE_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Long-running solver daemon that answers puzzle requests over a Unix domain socket
+
+Worker processes import every solver module once at startup, so a request only pays for
+the solve itself: no interpreter startup, no imports, and regular expressions stay in the
+`re` module's compiled pattern cache between requests. Requests and responses are single
+JSON lines:
+
+    {"year": 2015, "day": 7, "part": 1, "input": "123 -> x\\n..."}
+    {"ok": true, "answers": {"1": "956", "2": "40149"}, "answer": "956", "solve_ms": 4.1}
+
+Solvers that read an input file get the request input written to that file in a private
+temporary directory. Solvers whose puzzle input is hardcoded in `main()` go through a small
+adapter that parses the request input instead.
+
+Usage:
+    python daemon.py serve --socket /tmp/aoc.sock --workers 4
+    python daemon.py serve --dispatch                 # workers use the tuned variant dispatchers
+    python daemon.py request 2015 7 --part 1 < 2015/day7.txt
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import re
+import signal
+import socket
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from solvers import ROOT, discover_solvers, load_module, solver_name
+
+DEFAULT_SOCKET = "/tmp/adventofcode.sock"
+INPUT_PATTERN = re.compile(r'(?:filename = |open\()"(day\d+\.\w+)"')
+ANSWER_PATTERN = re.compile(r"^part\s*(\d+|one|two)\b[^:]*:\s*(.*)$", re.IGNORECASE | re.MULTILINE)
+
+MODULES: dict[str, ModuleType] = {}  # Solver modules preloaded in each worker
+INPUT_FILES: dict[str, str] = {}  # The input filename each file-based solver opens
+
+def numbers(text: str) -> list[int]:
+    """
+    Extract every integer from a puzzle input
+
+    Args:
+        text (str): The puzzle input
+
+    Returns:
+        list[int]: The integers in order of appearance
+    """
+    return [int(value) for value in re.findall(r"-?\d+", text)]
+
+def adventcoins(module: ModuleType, text: str, parts: tuple[str, ...]) -> dict[str, Any]:
+    """
+    Mine the 2015 day 4 AdventCoins of the requested parts in a single sweep
+
+    Args:
+        module (ModuleType): The day 4 solver module
+        text (str): The puzzle input, the secret key
+        parts (tuple[str, ...]): The part numbers to answer, part 1 stops at five leading zeros
+
+    Returns:
+        dict[str, Any]: The lowest number for each requested part
+    """
+    leading_zeros = {part: {"1": 5, "2": 6}[part] for part in parts if part in ("1", "2")}
+    coins = module.find_adventcoins((text.strip(), zeros) for zeros in leading_zeros.values())
+    return {part: coins[(text.strip(), zeros)][0] for part, zeros in leading_zeros.items()}
+
+# Solvers whose puzzle input is a constant inside main(), mapped to a function of the input text
+# and the requested part numbers
+ADAPTERS: dict[str, Callable[[ModuleType, str, tuple[str, ...]], dict[str, Any]]] = {
+    "2015/day4": adventcoins,
+    "2015/day10": lambda module, text, _: {
+        "1": len(module.look_and_say(text.strip(), 40)),
+        "2": len(module.look_and_say(text.strip(), 50)),
+    },
+    "2015/day11": lambda module, text, _: {
+        "1": module.find_next_password(text.strip()),
+        "2": module.find_next_password(text.strip(), 2),
+    },
+    "2015/day20": lambda module, text, _: {
+        "1": module.sieve_part1(numbers(text)[0]),
+        "2": module.sieve_part2(numbers(text)[0]),
+    },
+    "2015/day22": lambda module, text, _: {
+        "1": module.run_simulation(*numbers(text)[:2]),
+        "2": module.run_simulation(*numbers(text)[:2], hard_mode=True),
+    },
+    "2015/day25": lambda module, text, _: {
+        "1": module.find_code_at_position(*numbers(text)[:2]),
+    },
+}
+
+def preload(use_dispatch: bool = False) -> None:
+    """
+    Import every solver module into this worker and record which input file each one reads
+
+    Args:
+        use_dispatch (bool): If True, route size-dependent variants through the tuned dispatchers
+    """
+    for path in discover_solvers():
+        name = solver_name(path)
+        try:
+            MODULES[name] = load_module(path)
+            if use_dispatch:
+                import dispatch
+                dispatch.install(MODULES[name], name)
+        except ImportError:  # An optional dependency is missing, requests for this day fail later
+            continue
+        if match := INPUT_PATTERN.search(path.read_text(encoding="utf-8")):
+            INPUT_FILES[name] = match.group(1)
+
+def parse_answers(output: str) -> dict[str, str]:
+    """
+    Pick the answers out of a solver's printed output
+
+    Args:
+        output (str): Everything the solver printed
+
+    Returns:
+        dict[str, str]: The first answer printed for each part, keyed by part number
+    """
+    answers: dict[str, str] = {}
+    for part, answer in ANSWER_PATTERN.findall(output):
+        part = {"one": "1", "two": "2"}.get(part.lower(), part)
+        answers.setdefault(part, answer.strip())
+    return answers
+
+def solve(payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Solve one request inside a worker process
+
+    Args:
+        payload (dict[str, Any]): The request with "year", "day", "input" and optionally "part"
+
+    Returns:
+        dict[str, Any]: The response with the answers and the solve time
+    """
+    name = f"{payload['year']}/day{payload['day']}"
+    module = MODULES.get(name)
+    if module is None:
+        return {"ok": False, "error": f"No solver available for {name}"}
+
+    output = io.StringIO()
+    start = time.perf_counter()
+    if name in ADAPTERS:
+        parts = (str(payload["part"]),) if "part" in payload else ("1", "2")
+        answers = {part: str(answer) for part, answer in ADAPTERS[name](module, payload["input"], parts).items()}
+    elif name in INPUT_FILES:
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, INPUT_FILES[name]).write_text(payload["input"], encoding="utf-8")
+            os.chdir(directory)  # Each worker handles one request at a time, so this is safe
+            try:
+                with contextlib.redirect_stdout(output):
+                    module.main()
+            finally:
+                os.chdir(ROOT)
+        answers = parse_answers(output.getvalue())
+    else:
+        return {"ok": False, "error": f"{name} does not accept an input"}
+    solve_ms = (time.perf_counter() - start) * 1000
+
+    response: dict[str, Any] = {"ok": True, "answers": answers, "solve_ms": round(solve_ms, 3)}
+    if "part" in payload:
+        response["answer"] = answers.get(str(payload["part"]))
+    if not answers:
+        response["output"] = output.getvalue()
+    return response
+
+async def serve(socket_path: str, workers: int | None = None, use_dispatch: bool = False) -> None:
+    """
+    Accept newline-delimited JSON requests on a Unix socket and answer them from a worker pool
+
+    Args:
+        socket_path (str): The path of the Unix domain socket to listen on
+        workers (int | None): The number of worker processes, default is the CPU count
+        use_dispatch (bool): If True, workers route size-dependent variants through the tuned dispatchers
+    """
+    loop = asyncio.get_running_loop()
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=preload, initargs=(use_dispatch,))
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while line := await reader.readline():
+            start = time.perf_counter()
+            try:
+                response = await loop.run_in_executor(pool, solve, json.loads(line))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            response["total_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+        writer.close()
+
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(socket_path)
+    server = await asyncio.start_unix_server(handle, path=socket_path, limit=1 << 30)
+    loop.add_signal_handler(signal.SIGTERM, server.close)  # Shut down cleanly and remove the socket
+    print(f"Serving on {socket_path}")
+    try:
+        async with server:
+            with contextlib.suppress(asyncio.CancelledError):
+                await server.serve_forever()
+    finally:
+        pool.shutdown(cancel_futures=True)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+
+def request(socket_path: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Send one request to a running daemon and wait for its response
+
+    Args:
+        socket_path (str): The path of the daemon's Unix domain socket
+        payload (dict[str, Any]): The request
+
+    Returns:
+        dict[str, Any]: The daemon's response
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(payload).encode() + b"\n")
+        with client.makefile("rb") as responses:
+            return json.loads(responses.readline())
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the daemon
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Serve puzzle solves over a Unix domain socket")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="the socket path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="start the daemon")
+    serve_parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    serve_parser.add_argument("--dispatch", action="store_true", help="pick variants from the tuning file")
+
+    request_parser = commands.add_parser("request", help="send one request, the input is read from stdin")
+    request_parser.add_argument("year", type=int)
+    request_parser.add_argument("day", type=int)
+    request_parser.add_argument("--part", type=int, help="only print the answer to this part")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to start the daemon or send it a request
+    """
+    args = parse_args()
+    if args.command == "serve":
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(serve(args.socket, args.workers, args.dispatch))
+        return
+
+    payload: dict[str, Any] = {"year": args.year, "day": args.day, "input": sys.stdin.read()}
+    if args.part:
+        payload["part"] = args.part
+    print(json.dumps(request(args.socket, payload), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+"""
+Pick the fastest implementation variant for the size of the input
+
+Several solvers carry competing implementations whose ranking flips with the input size,
+e.g. brute force beats Held-Karp on a handful of cities but not on a dozen. The tune
+command times every variant on generated inputs of increasing size and stores the winner
+of each size range in a small tuning file. `install()` then swaps the function a solver's
+`main()` calls for a dispatcher that looks up the winner for the size of its arguments,
+so callers get the fastest path without editing `main()`. Without a tuning entry the
+original function is kept.
+
+Crossovers depend on the machine and on which optional dependencies are installed, so the
+tuning file is not committed and dispatching is opt-in. A tuning file written on another
+machine is ignored, a point is never tuned while one of its variants cannot be imported, and
+a tuning entry that never timed a variant available here is ignored.
+
+Usage:
+    python dispatch.py tune                       # measure every dispatch point on this machine
+    python dispatch.py tune day9 --repeat 5
+    python dispatch.py show
+    python runner.py --dispatch --days 5 9 15 18  # solvers run through the tuned dispatchers
+"""
+import argparse
+import functools
+import importlib.util
+import json
+import math
+import os
+import random
+import string
+import tempfile
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from solvers import ROOT, load_module
+
+TUNING_FILE = ROOT / "tuning.json"
+Crossovers = list[tuple[int, str]]  # (smallest size, variant) for each size range, in increasing order
+Tuned = tuple[list[str], Crossovers]  # The variants that were timed and the crossovers they produced
+
+@dataclass
+class DispatchPoint:
+    """
+    Represents a function of a solver module that can be served by several variants
+    """
+    attribute: str  # The module attribute main() calls, replaced by the dispatcher
+    variants: dict[str, Callable[..., Any]]
+    size: Callable[..., int]  # Measures the size of a call's arguments
+    sample: Callable[[int, Path], list[tuple[Any, ...]]]  # Builds the calls timed for one size
+    sizes: list[int]
+    requires: dict[str, Callable[..., bool]] = field(default_factory=dict)  # Preconditions of some variants
+    optional: dict[str, str] = field(default_factory=dict)  # Optional dependency each variant imports lazily
+
+PointFactory = Callable[[ModuleType], DispatchPoint]
+DISPATCH_POINTS: dict[str, tuple[str, PointFactory]] = {}
+
+def register(name: str, solver: str) -> Callable[[PointFactory], PointFactory]:
+    """
+    Register a dispatch point factory
+
+    Args:
+        name (str): The dispatch point name e.g. "2015/day5 part1"
+        solver (str): The solver short name the point belongs to e.g. "2015/day5"
+
+    Returns:
+        Callable[[PointFactory], PointFactory]: A decorator that registers the factory
+    """
+    def decorator(factory: PointFactory) -> PointFactory:
+        DISPATCH_POINTS[name] = (solver, factory)
+        return factory
+    return decorator
+
+def random_words(size: int, count: int = 2000, seed: int = 0) -> list[tuple[str]]:
+    """
+    Build calls of a string rule on random lowercase words
+
+    Args:
+        size (int): The length of each word
+        count (int): The number of words
+        seed (int): The random seed
+
+    Returns:
+        list[tuple[str]]: One single-argument call per word
+    """
+    rng = random.Random(seed)
+    return [("".join(rng.choices(string.ascii_lowercase, k=size)),) for _ in range(count)]
+
+@register("2015/day5 part1", "2015/day5")
+def day5_part1(module: ModuleType) -> DispatchPoint:
+    """
+    Part 1 nice string rules, sized by the word length
+    """
+    return DispatchPoint(
+        "is_nice",
+        {"is_nice": module.is_nice, "is_nice_regex": module.is_nice_regex, "is_nice_simple": module.is_nice_simple},
+        len,
+        lambda size, _: random_words(size),
+        [8, 16, 32, 64, 128, 256],
+    )
+
+@register("2015/day5 part2", "2015/day5")
+def day5_part2(module: ModuleType) -> DispatchPoint:
+    """
+    Part 2 nice string rules, sized by the word length
+    """
+    return DispatchPoint(
+        "is_nice_two",
+        {"is_nice_two": module.is_nice_two, "is_nice_two_regex": module.is_nice_two_regex, "is_nice_two_simple": module.is_nice_two_simple},
+        len,
+        lambda size, _: random_words(size),
+        [8, 16, 32, 64, 128, 256],
+    )
+
+@register("2015/day9", "2015/day9")
+def day9(module: ModuleType) -> DispatchPoint:
+    """
+    Shortest and longest routes, sized by the number of cities
+    """
+    def sample(size: int, directory: Path) -> list[tuple[Any, ...]]:
+        from generate import write_input
+        return [module.parse_input_file(str(write_input("day9", size, directory / "day9.txt")))]
+
+    return DispatchPoint(
+        "route_extremes",
+        {"route_extremes": module.route_extremes, "held_karp_extremes": module.held_karp_extremes},
+        lambda cities, _: len(cities),
+        sample,
+        [3, 4, 5, 6, 7, 8, 9],
+    )
+
+@register("2015/day15", "2015/day15")
+def day15(module: ModuleType) -> DispatchPoint:
+    """
+    Ingredient amount generators, sized by the total amount
+    """
+    return DispatchPoint(
+        "recursive_generate",
+        {
+            "recursive_generate": module.recursive_generate,
+            "generate_combinations": module.generate_combinations,
+            "generate_products": module.generate_products,
+        },
+        lambda _, total_amount=100: total_amount,
+        lambda size, _: [(4, size)],
+        [2, 4, 8, 16, 32],  # generate_products visits (total + 1) ** 4 candidates, keep it small
+        {"generate_combinations": lambda ingredient_count, total_amount=100: ingredient_count == 4},
+    )
+
+@register("2015/day18", "2015/day18")
+def day18(module: ModuleType) -> DispatchPoint:
+    """
+    Light simulations, sized by the bytes of the grid file
+    """
+    def sample(size: int, directory: Path) -> list[tuple[Any, ...]]:
+        from generate import write_input
+        return [(str(write_input("day18", size, directory / "day18.txt")), 10)]
+
+    return DispatchPoint(
+        "numpy_run",
+        {"numpy_run": module.numpy_run, "python_run": module.python_run},
+        lambda filename, _: os.path.getsize(filename),
+        sample,
+        [5, 10, 20, 40, 100],
+        optional={"numpy_run": "numpy"},
+    )
+
+def make_dispatcher(point: DispatchPoint, crossovers: Crossovers) -> Callable[..., Any]:
+    """
+    Build the function that replaces a dispatch point's attribute
+
+    Args:
+        point (DispatchPoint): The dispatch point
+        crossovers (Crossovers): The tuned size ranges and their winners
+
+    Returns:
+        Callable[..., Any]: The winning variant itself when it wins at every size, otherwise a dispatcher
+    """
+    default = point.variants[point.attribute]
+    winners = {variant for _, variant in crossovers}
+    if len(winners) == 1 and not point.requires.keys() & winners:
+        return point.variants[winners.pop()]  # Nothing to decide at call time
+
+    starts = [start for start, _ in crossovers]
+    functions = [point.variants[variant] for _, variant in crossovers]
+    checks = [point.requires.get(variant) for _, variant in crossovers]
+
+    @functools.wraps(default)
+    def dispatcher(*args: Any, **kwargs: Any) -> Any:
+        index = max(bisect_right(starts, point.size(*args, **kwargs)) - 1, 0)
+        check = checks[index]
+        if check is not None and not check(*args, **kwargs):
+            return default(*args, **kwargs)
+        return functions[index](*args, **kwargs)
+    return dispatcher
+
+def available_variants(point: DispatchPoint) -> list[str]:
+    """
+    List the variants of a dispatch point whose optional dependency can be imported
+
+    Args:
+        point (DispatchPoint): The dispatch point
+
+    Returns:
+        list[str]: The variant names that can run on this machine
+    """
+    return [variant for variant in point.variants if variant not in point.optional or importlib.util.find_spec(point.optional[variant])]
+
+@functools.cache
+def load_tuning(path: Path = TUNING_FILE) -> dict[str, Tuned]:
+    """
+    Read the timed variants and crossovers from the tuning file
+
+    Args:
+        path (Path): The tuning file
+
+    Returns:
+        dict[str, Tuned]: The timed variants and crossovers of each dispatch point, empty when the file is missing or was tuned on another machine
+    """
+    from history import machine_fingerprint
+
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            tuning = json.load(file)
+    except FileNotFoundError:
+        return {}
+    if tuning.get("machine") != machine_fingerprint():  # Crossovers measured elsewhere do not apply here
+        return {}
+    return {
+        name: (list(entry["variants"]), [(int(start), str(variant)) for start, variant in entry["crossovers"]])
+        for name, entry in tuning["points"].items()
+    }
+
+def install(module: ModuleType, name: str) -> None:
+    """
+    Replace the dispatch points of a solver module with tuned dispatchers
+
+    A point is left alone when its tuning never timed a variant that is available here,
+    e.g. it was tuned without numpy, or when one of its winners cannot run here
+
+    Args:
+        module (ModuleType): The imported solver module
+        name (str): The solver short name e.g. "2015/day5"
+    """
+    tuning = load_tuning()
+    for point_name, (solver, factory) in DISPATCH_POINTS.items():
+        if solver != name or point_name not in tuning:
+            continue
+        point = factory(module)
+        timed, crossovers = tuning[point_name]
+        available = set(available_variants(point))
+        if available - set(timed) or any(variant not in available for _, variant in crossovers):
+            continue
+        setattr(module, point.attribute, make_dispatcher(point, crossovers))
+
+def time_calls(func: Callable[..., Any], calls: list[tuple[Any, ...]], repeat: int) -> float:
+    """
+    Time a variant on a list of calls, draining any iterator it returns
+
+    Args:
+        func (Callable[..., Any]): The variant
+        calls (list[tuple[Any, ...]]): The arguments of each call
+        repeat (int): The number of timed passes
+
+    Returns:
+        float: The fastest pass in seconds
+    """
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in calls:
+            result = func(*args)
+            if isinstance(result, Iterator):
+                deque(result, maxlen=0)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def tune_point(name: str, repeat: int = 3) -> Crossovers:
+    """
+    Time every variant of a dispatch point at each of its sizes and collect the winners
+
+    Args:
+        name (str): The dispatch point name
+        repeat (int): The number of timed passes per variant and size
+
+    Returns:
+        Crossovers: The size ranges and their winners, boundaries sit at the geometric mean of neighbouring sizes
+
+    Raises:
+        ImportError: If a variant's optional dependency is missing, crossovers without it would be wrong elsewhere
+    """
+    solver, factory = DISPATCH_POINTS[name]
+    point = factory(load_module(ROOT / f"{solver}.py"))
+    if missing := {point.optional[variant] for variant in point.variants.keys() - set(available_variants(point))}:
+        raise ImportError(f"{', '.join(sorted(missing))} not installed")
+    winners: list[tuple[int, str]] = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for nominal in point.sizes:
+            calls = point.sample(nominal, Path(directory))
+            timings = {variant: time_calls(func, calls, repeat) for variant, func in point.variants.items()}
+            winners.append((point.size(*calls[0]), min(timings, key=timings.__getitem__)))
+
+    crossovers: Crossovers = [(0, winners[0][1])]
+    for (previous_size, previous), (size, variant) in zip(winners, winners[1:]):
+        if variant != previous:
+            crossovers.append((round(math.sqrt(previous_size * size)), variant))
+    return crossovers
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the dispatch tool
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Tune and inspect the size-based variant dispatchers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    tune_parser = commands.add_parser("tune", help="measure crossovers on this machine and update the tuning file")
+    tune_parser.add_argument("filters", nargs="*", help="only tune dispatch points whose name contains one of these")
+    tune_parser.add_argument("--repeat", type=int, default=3, help="timed passes per variant and size")
+
+    commands.add_parser("show", help="print the tuned crossovers")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to regenerate the tuning file or print its crossovers
+    """
+    args = parse_args()
+    tuned = dict(load_tuning())
+
+    if args.command == "tune":
+        import platform
+        from history import machine_fingerprint
+        for name, (solver, factory) in DISPATCH_POINTS.items():
+            if args.filters and not any(f in name for f in args.filters):
+                continue
+            try:
+                crossovers = tune_point(name, args.repeat)
+            except ImportError as exc:
+                tuned.pop(name, None)
+                print(f"Skipped {name}: {exc}")
+                continue
+            tuned[name] = (list(factory(load_module(ROOT / f"{solver}.py")).variants), crossovers)
+            print(f"Tuned {name}")
+        points = {name: {"variants": variants, "crossovers": crossovers} for name, (variants, crossovers) in tuned.items()}
+        tuning = {"machine": machine_fingerprint(), "python_version": platform.python_version(), "points": points}
+        TUNING_FILE.write_text(json.dumps(tuning, indent=2) + "\n", encoding="utf-8")
+
+    for name, (_, ranges) in tuned.items():
+        print(f"== {name}")
+        bounds = [start for start, _ in ranges[1:]] + [None]
+        for (start, variant), end in zip(ranges, bounds):
+            span = f"{start}+" if end is None else f"{start}-{end - 1}"
+            print(f"   size {span:<12} {variant}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Generate well-formed synthetic puzzle inputs of any size
+
+Each generator takes a size and a seeded random number generator and yields chunks of text
+in exactly the format of the real puzzle input, so files far larger than memory can be
+written without building them up front. What "size" means depends on the day, e.g.
+characters for day1, boxes for day2, gates for day7 and cities for day9.
+
+Usage:
+    python generate.py day2 1000000 -o day2_1m.txt
+    python generate.py day18 1000 --seed 7 -o day18_1000.txt
+"""
+import argparse
+import random
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from solvers import ROOT
+
+Generator = Callable[[int, random.Random], Iterator[str]]
+GENERATORS: dict[str, Generator] = {}
+CHUNK_SIZE = 1 << 20  # Characters per chunk for the character stream days
+
+def register(name: str) -> Callable[[Generator], Generator]:
+    """
+    Register an input generator under the given day name
+
+    Args:
+        name (str): The day name e.g. "day7"
+
+    Returns:
+        Callable[[Generator], Generator]: A decorator that registers the generator
+    """
+    def decorator(generator: Generator) -> Generator:
+        GENERATORS[name] = generator
+        return generator
+    return decorator
+
+def make_names(count: int, capitalize: bool = True) -> list[str]:
+    """
+    Build `count` distinct alphabetic names, "Aa", "Ab", ... in base 26
+
+    Args:
+        count (int): The number of names to build
+        capitalize (bool): If True, the first letter of each name is upper case
+
+    Returns:
+        list[str]: The names, each at least two letters long
+    """
+    names: list[str] = []
+    for index in range(26, count + 26):  # Start at 26 so every name has two letters or more
+        letters = ""
+        while index:
+            index, remainder = divmod(index, 26)
+            letters = chr(ord("a") + remainder) + letters
+        names.append(letters.capitalize() if capitalize else letters)
+    return names
+
+def random_stream(size: int, rng: random.Random, alphabet: bytes) -> Iterator[str]:
+    """
+    Yield `size` characters drawn uniformly from an alphabet whose length is a power of two
+
+    Args:
+        size (int): The number of characters to yield
+        rng (random.Random): The random number generator
+        alphabet (bytes): The characters to draw from
+
+    Returns:
+        Iterator[str]: Chunks of at most CHUNK_SIZE characters
+    """
+    table = bytes(alphabet[i % len(alphabet)] for i in range(256))  # Maps each random byte to a character
+    while size > 0:
+        count = min(size, CHUNK_SIZE)
+        yield rng.randbytes(count).translate(table).decode("ascii")
+        size -= count
+
+def tokenize(molecule: str) -> list[str]:
+    """
+    Split a molecule into its elements e.g. "CaSiRn" into ["Ca", "Si", "Rn"]
+
+    Args:
+        molecule (str): The molecule string
+
+    Returns:
+        list[str]: The elements of the molecule
+    """
+    tokens: list[str] = []
+    for char in molecule:
+        if char.islower() and tokens:
+            tokens[-1] += char
+        else:
+            tokens.append(char)
+    return tokens
+
+@register("day1")
+def day1(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield a stream of `size` parentheses
+    """
+    yield from random_stream(size, rng, b"()")
+
+@register("day2")
+def day2(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield `size` lines of box dimensions "LxWxH"
+    """
+    for _ in range(size):
+        yield f"{rng.randint(1, 30)}x{rng.randint(1, 30)}x{rng.randint(1, 30)}\n"
+
+@register("day3")
+def day3(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield a stream of `size` directions `^`, `v`, `>` and `<`
+    """
+    yield from random_stream(size, rng, b"^v><")
+
+@register("day5")
+def day5(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield `size` lines of 16 random lowercase letters
+    """
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    for _ in range(size):
+        yield "".join(rng.choices(letters, k=16)) + "\n"
+
+@register("day6")
+def day6(size: int, rng: random.Random, extent: int = 1000) -> Iterator[str]:
+    """
+    Yield `size` lighting instructions for a square grid of side `extent`
+    """
+    for _ in range(size):
+        command = rng.choice(("turn on", "turn off", "toggle"))
+        x0, x1 = sorted(rng.randrange(extent) for _ in range(2))
+        y0, y1 = sorted(rng.randrange(extent) for _ in range(2))
+        yield f"{command} {x0},{y0} through {x1},{y1}\n"
+
+@register("day7")
+def day7(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield a shuffled acyclic circuit of `size` gates that drives wires "a" and "b"
+
+    Every gate only reads wires defined before it, and "b" is a plain signal so that part 2
+    can override it
+    """
+    wires = make_names(size, capitalize=False)
+    signals = max(2, size // 10)
+    lines = [f"{rng.randrange(65536)} -> b\n"]
+    lines.extend(f"{rng.randrange(65536)} -> {wire}\n" for wire in wires[:signals])
+    defined = ["b"] + wires[:signals]
+
+    for wire in wires[signals:]:
+        kind = rng.random()
+        left = rng.choice(defined)
+        if kind < 0.1:
+            lines.append(f"NOT {left} -> {wire}\n")
+        elif kind < 0.3:
+            lines.append(f"{left} {rng.choice(('LSHIFT', 'RSHIFT'))} {rng.randint(1, 15)} -> {wire}\n")
+        else:
+            lines.append(f"{left} {rng.choice(('AND', 'OR'))} {rng.choice(defined)} -> {wire}\n")
+        defined.append(wire)
+    lines.append(f"{defined[-1]} -> a\n")
+
+    rng.shuffle(lines)
+    yield from lines
+
+@register("day9")
+def day9(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield the distances between every pair of `size` cities
+    """
+    cities = make_names(size)
+    for i, city_a in enumerate(cities):
+        for city_b in cities[i + 1:]:
+            yield f"{city_a} to {city_b} = {rng.randint(1, 150)}\n"
+
+@register("day13")
+def day13(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield the happiness of every ordered pair of `size` guests
+    """
+    guests = make_names(size)
+    for guest in guests:
+        for neighbour in guests:
+            if guest != neighbour:
+                action = rng.choice(("gain", "lose"))
+                yield f"{guest} would {action} {rng.randint(1, 100)} happiness units by sitting next to {neighbour}.\n"
+
+@register("day14")
+def day14(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield `size` reindeer descriptions
+    """
+    for name in make_names(size):
+        yield f"{name} can fly {rng.randint(1, 30)} km/s for {rng.randint(1, 20)} seconds, but then must rest for {rng.randint(10, 200)} seconds.\n"
+
+@register("day18")
+def day18(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield a `size` by `size` grid of lights
+    """
+    for _ in range(size):
+        yield "".join(rng.choices("#.", k=size)) + "\n"
+
+@register("day19")
+def day19(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yield the real replacement rules followed by a molecule built from `size` random replacements
+
+    The molecule is grown forward from "e", so it can always be reduced back to "e" and the
+    part 2 formula stays valid
+    """
+    forward: dict[str, list[list[str]]] = {}
+    with open(ROOT / "2015" / "day19.txt", "r", encoding="utf-8") as file:
+        rules = [line for line in file if "=>" in line]
+    for rule in rules:
+        lhs, rhs = rule.strip().split(" => ")
+        forward.setdefault(lhs, []).append(tokenize(rhs))
+
+    molecule = rng.choice(forward["e"])[:]
+    for _ in range(size):
+        candidates = [i for i, token in enumerate(molecule) if token in forward]
+        if not candidates:
+            break
+        index = rng.choice(candidates)
+        molecule[index:index + 1] = rng.choice(forward[molecule[index]])
+
+    yield from rules
+    yield "\n"
+    yield "".join(molecule) + "\n"
+
+def write_input(name: str, size: int, path: str | Path, seed: int = 0) -> Path:
+    """
+    Write a synthetic input file for a day
+
+    Args:
+        name (str): The registered day name e.g. "day7"
+        size (int): The size of the input, meaning depends on the day
+        path (str | Path): The file to write
+        seed (int): The random seed, the same seed always produces the same file
+
+    Returns:
+        Path: The path of the written file
+    """
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        for chunk in GENERATORS[name](size, rng):
+            file.write(chunk)
+    return Path(path)
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the generator
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Generate synthetic Advent of Code inputs")
+    parser.add_argument("day", choices=sorted(GENERATORS), help="the day to generate input for")
+    parser.add_argument("size", type=int, help="the size of the input, meaning depends on the day")
+    parser.add_argument("-o", "--output", help="the file to write, default is stdout")
+    parser.add_argument("--seed", type=int, default=0, help="the random seed")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to write a synthetic input to a file or stdout
+    """
+    args = parse_args()
+    if args.output:
+        write_input(args.day, args.size, args.output, args.seed)
+    else:
+        for chunk in GENERATORS[args.day](args.size, random.Random(args.seed)):
+            sys.stdout.write(chunk)
+
+if __name__ == "__main__":
+    main()
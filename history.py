@@ -0,0 +1,292 @@
+"""
+Persistent benchmark history with regression detection
+
+Benchmark and scaling runs can be recorded in a local SQLite database, tagged with the git
+commit, the Python version and a fingerprint of the machine. The compare command checks
+the latest run against a rolling baseline of earlier runs on the same machine and flags a
+result when it is both meaningfully slower and statistically significant (one-sided
+Mann-Whitney U test on the raw timings).
+
+Usage:
+    python benchmark.py --record
+    python scaling.py day2 day7 --record
+    python history.py compare --baseline 5
+    python history.py list
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+from solvers import ROOT
+
+DATABASE = ROOT / "benchmarks.sqlite"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    git_commit TEXT NOT NULL,
+    python_version TEXT NOT NULL,
+    machine TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    benchmark TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    median REAL NOT NULL,
+    p95 REAL NOT NULL,
+    peak_bytes INTEGER,
+    timings TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_key ON results (benchmark, variant, size);
+"""
+
+@dataclass
+class Result:
+    """
+    Represents one measured (benchmark, variant, size) combination
+    """
+    benchmark: str
+    variant: str
+    size: int
+    timings: list[float]
+    peak_bytes: int | None = None
+
+def connect(path: str | os.PathLike[str] = DATABASE) -> sqlite3.Connection:
+    """
+    Open the history database, creating the tables on first use
+
+    Args:
+        path (str | os.PathLike[str]): The database file
+
+    Returns:
+        sqlite3.Connection: The open connection
+    """
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    return connection
+
+def git_commit() -> str:
+    """
+    Describe the current git commit, marking uncommitted changes
+
+    Returns:
+        str: The short commit hash, with "-dirty" when the tree has changes, or "unknown"
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD"], cwd=ROOT, check=False).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+def machine_fingerprint() -> str:
+    """
+    Identify the machine so timings are only compared with timings from the same hardware
+
+    Returns:
+        str: A short hash of the host name, architecture, processor and CPU count
+    """
+    description = "|".join((platform.node(), platform.machine(), platform.processor(), str(os.cpu_count())))
+    return hashlib.sha256(description.encode()).hexdigest()[:12]
+
+def percentile_95(timings: list[float]) -> float:
+    """
+    Compute the 95th percentile of a list of timings
+
+    Args:
+        timings (list[float]): The timings, at least one
+
+    Returns:
+        float: The 95th percentile interpolated between observed timings, or the only timing when there is just one
+    """
+    # The default exclusive method extrapolates past the slowest timing for small samples
+    return statistics.quantiles(timings, n=20, method="inclusive")[-1] if len(timings) > 1 else timings[0]
+
+def record_run(results: list[Result], path: str | os.PathLike[str] = DATABASE) -> int:
+    """
+    Store the results of one benchmark run
+
+    Args:
+        results (list[Result]): The measured results
+        path (str | os.PathLike[str]): The database file
+
+    Returns:
+        int: The id of the stored run
+    """
+    with connect(path) as connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (created, git_commit, python_version, machine) VALUES (?, ?, ?, ?)",
+            (time.time(), git_commit(), platform.python_version(), machine_fingerprint()),
+        )
+        run_id = cursor.lastrowid
+        assert run_id is not None
+        connection.executemany(
+            "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (run_id, result.benchmark, result.variant, result.size, statistics.median(result.timings),
+                 percentile_95(result.timings), result.peak_bytes, json.dumps(result.timings))
+                for result in results
+            ],
+        )
+    return run_id
+
+def mann_whitney_p(slower: list[float], faster: list[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that `slower` tends to be larger than `faster`
+
+    Uses the normal approximation with a tie correction, which is adequate for the handful
+    of repeats a benchmark records
+
+    Args:
+        slower (list[float]): The samples suspected to be larger
+        faster (list[float]): The reference samples
+
+    Returns:
+        float: The p-value, small values mean `slower` is significantly larger
+    """
+    n1, n2 = len(slower), len(faster)
+    ranked = sorted([(value, 0) for value in slower] + [(value, 1) for value in faster])
+
+    ranks = [0.0] * len(ranked)
+    tie_term = 0.0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1  # Average rank for tied values
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u_statistic = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u_statistic - mean - 0.5) / math.sqrt(variance)  # Continuity correction
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def compare_latest(baseline_runs: int = 5, threshold: float = 0.10, alpha: float = 0.01, path: str | os.PathLike[str] = DATABASE) -> list[tuple[str, float, float, float | None]]:
+    """
+    Compare the latest run with the preceding runs on the same machine
+
+    Args:
+        baseline_runs (int): How many earlier runs form the rolling baseline
+        threshold (float): The minimum relative slowdown of the median to report
+        alpha (float): The significance level of the Mann-Whitney U test
+        path (str | os.PathLike[str]): The database file
+
+    Returns:
+        list[tuple[str, float, float, float | None]]: For each significant or untestable slowdown its label, baseline median, latest median and p-value (None when either side has a single sample and cannot be tested)
+    """
+    with connect(path) as connection:
+        latest = connection.execute("SELECT id, machine FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+        if latest is None:
+            return []
+        latest_id, machine = latest
+        baseline_ids = [row[0] for row in connection.execute(
+            "SELECT id FROM runs WHERE machine = ? AND id < ? ORDER BY id DESC LIMIT ?",
+            (machine, latest_id, baseline_runs),
+        )]
+        if not baseline_ids:
+            return []
+
+        regressions: list[tuple[str, float, float, float | None]] = []
+        placeholders = ",".join("?" * len(baseline_ids))
+        for benchmark, variant, size, timings in connection.execute(
+            "SELECT benchmark, variant, size, timings FROM results WHERE run_id = ?", (latest_id,)
+        ).fetchall():
+            baseline: list[float] = []
+            for (samples,) in connection.execute(
+                f"SELECT timings FROM results WHERE run_id IN ({placeholders}) AND benchmark = ? AND variant = ? AND size = ?",
+                (*baseline_ids, benchmark, variant, size),
+            ):
+                baseline.extend(json.loads(samples))
+            current = json.loads(timings)
+            if not baseline:
+                continue
+
+            before, after = statistics.median(baseline), statistics.median(current)
+            if after <= before * (1 + threshold):
+                continue
+            p_value = mann_whitney_p(current, baseline) if len(current) > 1 and len(baseline) > 1 else None
+            if p_value is None or p_value < alpha:
+                label = f"{benchmark} [{variant}]" + (f" size={size}" if size else "")
+                regressions.append((label, before, after, p_value))
+    return regressions
+
+def list_runs(limit: int = 20, path: str | os.PathLike[str] = DATABASE) -> None:
+    """
+    Print the most recent recorded runs
+
+    Args:
+        limit (int): The number of runs to show
+        path (str | os.PathLike[str]): The database file
+    """
+    with connect(path) as connection:
+        rows = connection.execute(
+            "SELECT runs.id, created, git_commit, python_version, machine, COUNT(results.run_id) "
+            "FROM runs LEFT JOIN results ON results.run_id = runs.id GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+    print(f"{'run':>5}  {'recorded':<19}  {'commit':<14} {'python':<8} {'machine':<12} {'results':>7}")
+    for run_id, created, commit, python_version, machine, count in rows:
+        recorded = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+        print(f"{run_id:>5}  {recorded:<19}  {commit:<14} {python_version:<8} {machine:<12} {count:>7}")
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the history tool
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Inspect benchmark history and detect regressions")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compare_parser = commands.add_parser("compare", help="compare the latest run with a rolling baseline")
+    compare_parser.add_argument("--baseline", type=int, default=5, help="number of earlier runs in the baseline")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="minimum relative slowdown to flag")
+    compare_parser.add_argument("--alpha", type=float, default=0.01, help="significance level")
+
+    list_parser = commands.add_parser("list", help="show recorded runs")
+    list_parser.add_argument("--limit", type=int, default=20, help="number of runs to show")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to list recorded runs or flag regressions in the latest one
+    """
+    args = parse_args()
+    if args.command == "list":
+        list_runs(args.limit)
+        return
+
+    slowdowns = compare_latest(args.baseline, args.threshold, args.alpha)
+    regressions = [slowdown for slowdown in slowdowns if slowdown[3] is not None]
+    for label, before, after, p_value in regressions:
+        print(f"REGRESSION {label}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms ({after / before:.2f}x, p={p_value:.4f})")
+    for label, before, after, p_value in slowdowns:
+        if p_value is None:  # Reported, but a single sample cannot show the slowdown is significant
+            print(f"UNTESTED {label}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms ({after / before:.2f}x, record with --repeat 2 or more to test)")
+    print(f"{len(regressions)} regression(s) found, {len(slowdowns) - len(regressions)} untested slowdown(s)")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Check that importing each solver stays within an import-time budget
+
+Every solver module is imported in a fresh interpreter started with `-X importtime`, and the
+cumulative time of the modules it pulls in at import time is compared against the budget.
+Heavy dependencies such as numpy or matplotlib belong inside the functions that use them,
+so a text-only solve never pays for them.
+
+Usage:
+    python import_budget.py                       # every solver, default budget
+    python import_budget.py --budget-ms 20 --years 2016
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+from solvers import discover_solvers, solver_name
+
+MARKER = "--- solver import starts ---"
+LOADER = """
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("solver", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.stderr.write({marker!r} + "\\n")
+spec.loader.exec_module(module)
+"""
+
+def import_times(path: Path) -> list[tuple[str, int]]:
+    """
+    Import a solver in a fresh interpreter and collect the top-level imports it triggers
+
+    Args:
+        path (Path): The path to the solver module
+
+    Returns:
+        list[tuple[str, int]]: The name and cumulative import time in microseconds of each module imported directly by the solver
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOADER.format(marker=MARKER), str(path)],
+        capture_output=True, text=True, check=False,
+    )
+    _, _, report = completed.stderr.partition(MARKER)
+
+    imports: list[tuple[str, int]] = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):  # Nested imports are already counted in their parent's cumulative time
+            continue
+        if cumulative.strip().isdigit():
+            imports.append((name.strip(), int(cumulative)))
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1]
+        imports.append((f"<failed: {error}>", 0))
+    return imports
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the import budget check
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Check solver import times against a budget")
+    parser.add_argument("--budget-ms", type=float, default=25.0, help="the import-time budget per solver")
+    parser.add_argument("--years", nargs="*", help="year directories to check e.g. 2015 2016")
+    parser.add_argument("--days", nargs="*", type=int, help="day numbers to check")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to report solver import times and fail when any exceeds the budget
+    """
+    args = parse_args()
+    over_budget = 0
+
+    print(f"{'solver':<18} {'imports (ms)':>12}  heaviest import")
+    for path in discover_solvers(args.years, args.days):
+        imports = import_times(path)
+        total_ms = sum(cumulative for _, cumulative in imports) / 1000
+        heaviest = max(imports, key=lambda item: item[1], default=("-", 0))
+        status = "" if total_ms <= args.budget_ms else "  OVER BUDGET"
+        over_budget += bool(status)
+        print(f"{solver_name(path):<18} {total_ms:>12.2f}  {heaviest[0]} ({heaviest[1] / 1000:.2f} ms){status}")
+
+    print(f"{over_budget} solver(s) over the {args.budget_ms:g} ms budget")
+    sys.exit(1 if over_budget else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Measure the peak memory of a solver
+
+tracemalloc reports the peak of Python allocations, and a background thread samples the
+process RSS, which also covers memory held by numpy and other C extensions. The same thread
+takes a tracemalloc snapshot whenever traced memory grows well past the previous snapshot,
+so the allocation sites reported are the ones alive close to the peak rather than whatever
+is left over when the solver returns.
+
+Usage:
+    python runner.py --memory
+    python runner.py --days 9 14 19 24 --memory --memory-budget-mb 50
+"""
+import resource
+import sys
+import threading
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+SAMPLE_INTERVAL = 0.005  # Seconds between RSS and traced memory samples
+SNAPSHOT_GROWTH = 1.1  # Take a new snapshot once traced memory grows by 10%
+
+@dataclass
+class MemoryReport:
+    """
+    Represents the memory used by one call
+    """
+    peak_traced: int
+    max_rss: int
+    top_sites: list[tuple[str, int]] = field(default_factory=list)
+
+def current_rss() -> int:
+    """
+    Read the resident set size of this process
+
+    Returns:
+        int: The RSS in bytes, or 0 where /proc is unavailable
+    """
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as file:
+            return int(file.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return 0
+
+def max_rss_so_far() -> int:
+    """
+    Read the highest RSS this process has reached since it started
+
+    Returns:
+        int: The maximum RSS in bytes
+    """
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024  # Linux reports kilobytes
+
+def measure_memory(func: Callable[[], Any], top: int = 5) -> tuple[Any, MemoryReport]:
+    """
+    Run a function while tracing its allocations and sampling the process RSS
+
+    Args:
+        func (Callable[[], Any]): The function to measure
+        top (int): The number of allocation sites to report
+
+    Returns:
+        tuple[Any, MemoryReport]: The function's result and the memory it used
+    """
+    stop = threading.Event()
+    peak_rss = current_rss()
+    snapshot: tracemalloc.Snapshot | None = None
+    snapshot_size = 0
+
+    def sample() -> None:
+        nonlocal peak_rss, snapshot, snapshot_size
+        while not stop.wait(SAMPLE_INTERVAL):
+            peak_rss = max(peak_rss, current_rss())
+            traced, _ = tracemalloc.get_traced_memory()
+            if traced > snapshot_size * SNAPSHOT_GROWTH:
+                snapshot, snapshot_size = tracemalloc.take_snapshot(), traced
+
+    tracemalloc.start()
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = func()
+    finally:
+        stop.set()
+        sampler.join()
+        _, peak_traced = tracemalloc.get_traced_memory()
+        if snapshot is None:
+            snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),  # The sampler thread itself
+        tracemalloc.Filter(False, __file__),
+    ])
+    sites = [
+        (f"{stat.traceback[0].filename.rsplit('/', 1)[-1]}:{stat.traceback[0].lineno}", stat.size)
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+    return result, MemoryReport(peak_traced, max(peak_rss, max_rss_so_far()), sites)
@@ -0,0 +1,223 @@
+"""
+Profile a solver and report where its time goes
+
+Two profilers are available. "cprofile" records every call with cProfile, which is exact
+but slows down call-heavy code such as day7's calculate or day22's simulate. "sample"
+interrupts the process on a CPU timer and records the current stack, which has little
+overhead and gives true stacks. Both write a sorted text report and a collapsed-stack file
+that flamegraph tools (flamegraph.pl, speedscope, inferno) read directly.
+
+Usage:
+    python runner.py --days 18 --profile cprofile
+    python profiling.py 2015/day18 --mode sample --function count_on_neighbours
+"""
+import argparse
+import cProfile
+import inspect
+import io
+import os
+import pstats
+import signal
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from solvers import ROOT, load_module
+
+PROFILE_DIR = ROOT / "profiles"
+SAMPLE_INTERVAL = 0.001  # Requested seconds of CPU time between samples, the kernel rounds it up to its tick
+Label = tuple[str, int, str]  # (filename, line number, function name) as used by pstats
+
+def label_name(label: Label) -> str:
+    """
+    Format a function label for reports, without the separators used by collapsed stacks
+
+    Args:
+        label (Label): The filename, line number and function name
+
+    Returns:
+        str: A name like "count_on_neighbours (day18.py:190)"
+    """
+    filename, line, name = label
+    if filename == "~":  # Built-in functions have no source location
+        return name.replace(";", ",")
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(";", ",")
+
+def collapse_cprofile(stats: pstats.Stats, min_fraction: float = 1e-4) -> Counter[str]:
+    """
+    Turn cProfile's caller graph into collapsed stacks
+
+    cProfile only records caller/callee edges, so each function's own time is split across
+    the paths leading to it in proportion to the time spent along each edge
+
+    Args:
+        stats (pstats.Stats): The collected statistics
+        min_fraction (float): Paths carrying less than this share of a function's time are dropped
+
+    Returns:
+        Counter[str]: Microseconds of own time for each semicolon separated stack
+    """
+    table: dict[Label, Any] = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Label, list[Label]] = {}
+    for func, (_, _, _, _, callers) in table.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(func)
+
+    stacks: Counter[str] = Counter()
+
+    def visit(func: Label, stack: list[str], fraction: float) -> None:
+        _, _, own_time, total_time, _ = table[func]
+        stack.append(label_name(func))
+        if (micros := round(own_time * fraction * 1e6)) > 0:
+            stacks[";".join(stack)] += micros
+        for callee in callees.get(func, []):
+            callee_total = table[callee][3]
+            edge_time = table[callee][4][func][3]
+            if callee_total <= 0 or label_name(callee) in stack:
+                continue
+            share = fraction * edge_time / callee_total
+            if share >= min_fraction and total_time > 0:
+                visit(callee, stack, share)
+        stack.pop()
+
+    for func, (_, _, _, _, callers) in table.items():
+        if not callers:  # Roots of the call graph
+            visit(func, [], 1.0)
+    return stacks
+
+def profile_cprofile(func: Callable[[], Any]) -> tuple[Any, str, Counter[str]]:
+    """
+    Run a function under cProfile
+
+    Args:
+        func (Callable[[], Any]): The function to profile
+
+    Returns:
+        tuple[Any, str, Counter[str]]: The function's result, the text report and the collapsed stacks
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func)
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(40)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(20)
+    return result, report.getvalue(), collapse_cprofile(stats)
+
+def profile_sample(func: Callable[[], Any], interval: float = SAMPLE_INTERVAL) -> tuple[Any, str, Counter[str]]:
+    """
+    Run a function under a CPU-timer sampling profiler
+
+    The profiling timer only fires on kernel ticks, so samples arrive less often than
+    requested. Each sample is weighted by the measured CPU time divided by the number of
+    samples, not by the requested interval
+
+    Args:
+        func (Callable[[], Any]): The function to profile, must run in the main thread
+        interval (float): Requested seconds of CPU time between samples
+
+    Returns:
+        tuple[Any, str, Counter[str]]: The function's result, the text report and the collapsed stacks
+    """
+    samples: Counter[tuple[Label, ...]] = Counter()
+    profiler_frame = inspect.currentframe()
+
+    def record(_signum: int, frame: FrameType | None) -> None:
+        stack: list[Label] = []
+        while frame is not None and frame is not profiler_frame:  # Stop at the caller's frames
+            code = frame.f_code
+            stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        samples[tuple(reversed(stack))] += 1
+
+    previous = signal.signal(signal.SIGPROF, record)
+    cpu_start = time.process_time()
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        result = func()
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        cpu_time = time.process_time() - cpu_start
+        signal.signal(signal.SIGPROF, previous)
+
+    count = sum(samples.values())
+    weight = cpu_time / count if count else 0.0  # Seconds of CPU time each sample stands for
+
+    own: Counter[Label] = Counter()
+    total: Counter[Label] = Counter()
+    stacks: Counter[str] = Counter()
+    for stack, hits in samples.items():
+        own[stack[-1]] += hits
+        for label in set(stack):
+            total[label] += hits
+        stacks[";".join(label_name(label) for label in stack)] += round(hits * weight * 1e6)
+
+    header = f"{count} samples over {cpu_time:.3f} s of CPU time, one every {weight * 1000:.3g} ms on average (requested {interval * 1000:g} ms)"
+    lines = [header, "", f"{'own (s)':>9} {'total (s)':>10}  function"]
+    for label, _ in own.most_common(40):
+        lines.append(f"{own[label] * weight:>9.3f} {total[label] * weight:>10.3f}  {label_name(label)}")
+    return result, "\n".join(lines) + "\n", stacks
+
+def profile_call(func: Callable[[], Any], name: str, mode: str = "cprofile", out_dir: Path = PROFILE_DIR) -> tuple[Any, Path, Path]:
+    """
+    Profile a call and write its text report and collapsed stacks
+
+    Args:
+        func (Callable[[], Any]): The function to profile e.g. a solver's `main`
+        name (str): The solver short name e.g. "2015/day18", used for the file names
+        mode (str): Either "cprofile" or "sample"
+        out_dir (Path): The directory to write the reports to
+
+    Returns:
+        tuple[Any, Path, Path]: The function's result, the text report path and the collapsed stack path
+    """
+    profilers = {"cprofile": profile_cprofile, "sample": profile_sample}
+    result, report, stacks = profilers[mode](func)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = name.replace("/", "_")
+    report_path = out_dir / f"{stem}.{mode}.txt"
+    collapsed_path = out_dir / f"{stem}.{mode}.collapsed"
+    report_path.write_text(report, encoding="utf-8")
+    collapsed_path.write_text("".join(f"{stack} {micros}\n" for stack, micros in stacks.items()), encoding="utf-8")
+    return result, report_path, collapsed_path
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the profiler
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Profile a single solver's main()")
+    parser.add_argument("solver", help="the solver short name e.g. 2015/day18")
+    parser.add_argument("--mode", choices=("cprofile", "sample"), default="cprofile", help="the profiler to use")
+    parser.add_argument("--function", help="only print report lines mentioning this function")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to profile one solver and print its hot paths
+    """
+    args = parse_args()
+    path = ROOT / f"{args.solver}.py"
+    os.chdir(path.parent)  # Solvers open their input relative to their own directory
+
+    module = load_module(path)
+    _, report_path, collapsed_path = profile_call(module.main, args.solver, args.mode)
+
+    report = report_path.read_text(encoding="utf-8")
+    if args.function:
+        report = "".join(line for line in report.splitlines(keepends=True) if args.function in line)
+    print(report)
+    print(f"Report: {report_path}")
+    print(f"Collapsed stacks: {collapsed_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Run every Advent of Code solver in the repository and report per-day timings
+
+Each `<year>/day<N>.py` module exposing a `main()` function is discovered automatically and
+executed in a worker process of a ProcessPoolExecutor. Workers switch into the module's own
+directory before calling `main()`, so the hardcoded input filenames resolve no matter where
+the runner is launched from.
+
+Usage:
+    python runner.py                      # every year, every day
+    python runner.py --years 2015 --days 4 20 22
+    python runner.py --workers 1          # serial run for comparison
+    python runner.py --cache              # reuse parsed inputs from the on-disk cache
+    python runner.py --dispatch           # swap in the fastest variants measured by `dispatch.py tune`
+    python runner.py --profile sample     # write hot-path reports and flamegraph stacks
+    python runner.py --memory             # report peak traced memory, top allocation sites and max RSS
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from solvers import discover_solvers, load_module, solver_name
+
+@dataclass
+class SolverResult:
+    """
+    Represents the outcome of running a single solver
+    """
+    name: str
+    wall_time: float
+    cpu_time: float
+    output: str
+    error: str | None = None
+    report: str | None = None
+    peak_traced: int | None = None
+    max_rss: int | None = None
+    top_sites: list[tuple[str, int]] = field(default_factory=list)
+
+@dataclass
+class RunOptions:
+    """
+    Represents how each solver should be run
+    """
+    use_cache: bool = False  # Route file parsers through the parsed input cache
+    profile: str | None = None  # Profiler mode, "cprofile" or "sample"
+    memory: bool = False  # Measure peak traced memory and RSS
+    dispatch: bool = False  # Route size-dependent variants through the tuned dispatchers
+
+def run_solver(path: str, options: RunOptions | None = None) -> SolverResult:
+    """
+    Import a solver and time its `main()` function, capturing everything it prints
+
+    Args:
+        path (str): The path to the solver module
+        options (RunOptions | None): How to run the solver, default is a plain timed run
+
+    Returns:
+        SolverResult: The timings and captured output of the solver
+    """
+    options = options or RunOptions()
+    name = solver_name(Path(path))
+    buffer = io.StringIO()
+    result = SolverResult(name, 0.0, 0.0, "")
+
+    os.chdir(Path(path).resolve().parent)  # Solvers open their input relative to their own directory
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            module = load_module(path)
+            if options.use_cache:
+                import cache
+                cache.install(module, name)
+            if options.dispatch:
+                import dispatch
+                dispatch.install(module, name)
+            if options.profile:
+                import profiling
+                _, report_path, _ = profiling.profile_call(module.main, name, options.profile)
+                result.report = str(report_path)
+            elif options.memory:
+                import memory
+                _, usage = memory.measure_memory(module.main)
+                result.peak_traced, result.max_rss, result.top_sites = usage.peak_traced, usage.max_rss, usage.top_sites
+            else:
+                module.main()
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        result.error = f"{type(exc).__name__}: {exc}"
+    result.wall_time = time.perf_counter() - wall_start
+    result.cpu_time = time.process_time() - cpu_start
+    result.output = buffer.getvalue()
+    return result
+
+def run_all(solvers: list[Path], workers: int | None = None, options: RunOptions | None = None) -> list[SolverResult]:
+    """
+    Run solvers across a process pool
+
+    Args:
+        solvers (list[Path]): The solver modules to run
+        workers (int | None): The number of worker processes, default is the CPU count
+        options (RunOptions | None): How to run each solver, default is a plain timed run
+
+    Returns:
+        list[SolverResult]: The results in the same order as `solvers`
+    """
+    results: dict[str, SolverResult] = {}
+    # RSS is per process, so memory runs give every solver a fresh worker
+    max_tasks = 1 if options and options.memory else None
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=max_tasks) as executor:
+        futures = [executor.submit(run_solver, str(path), options) for path in solvers]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.name] = result
+    return [results[solver_name(path)] for path in solvers]
+
+def print_summary(results: list[SolverResult], total_wall: float, show_output: bool = False, memory_budget: float | None = None) -> None:
+    """
+    Print a table of per-solver timings followed by the totals
+
+    Args:
+        results (list[SolverResult]): The results to report
+        total_wall (float): The wall time of the whole run in seconds
+        show_output (bool): If True, print each solver's captured output under its row
+        memory_budget (float | None): Flag solvers whose peak traced memory exceeds this many MiB
+    """
+    show_memory = any(result.peak_traced is not None for result in results)
+    memory_header = f" {'peak (MiB)':>10} {'rss (MiB)':>10}" if show_memory else ""
+    print(f"{'solver':<18} {'wall (s)':>10} {'cpu (s)':>10}{memory_header}  status")
+    print("-" * (50 + len(memory_header)))
+    for result in results:
+        status = "ok" if result.error is None else result.error
+        memory_columns = ""
+        if result.peak_traced is not None and result.max_rss is not None:
+            peak_mib, rss_mib = result.peak_traced / 2**20, result.max_rss / 2**20
+            memory_columns = f" {peak_mib:>10.2f} {rss_mib:>10.2f}"
+            if memory_budget is not None and peak_mib > memory_budget:
+                status += ", OVER MEMORY BUDGET"
+        elif show_memory:
+            memory_columns = f" {'-':>10} {'-':>10}"
+        print(f"{result.name:<18} {result.wall_time:>10.3f} {result.cpu_time:>10.3f}{memory_columns}  {status}")
+        if show_output:
+            for line in result.output.splitlines():
+                print(f"    {line}")
+        if result.report:
+            print(f"    profile: {result.report}")
+        for site, size in result.top_sites[:3]:
+            print(f"    {size / 2**20:>8.2f} MiB  {site}")
+    print("-" * (50 + len(memory_header)))
+
+    serial_wall = sum(result.wall_time for result in results)
+    slowest = max(results, key=lambda result: result.wall_time)
+    print(f"Total wall time: {total_wall:.3f}s (sum of solvers {serial_wall:.3f}s)")
+    print(f"Slowest solver: {slowest.name} ({slowest.wall_time:.3f}s)")
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the runner
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Run Advent of Code solvers in parallel")
+    parser.add_argument("--years", nargs="*", help="year directories to run e.g. 2015 2022")
+    parser.add_argument("--days", nargs="*", type=int, help="day numbers to run e.g. 4 20 22")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--output", action="store_true", help="show the output of each solver")
+    parser.add_argument("--cache", action="store_true", help="load parsed inputs from the on-disk cache")
+    parser.add_argument("--dispatch", action="store_true", help="pick variants from the tuning file")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--profile", choices=("cprofile", "sample"), help="profile each solver and write reports")
+    mode.add_argument("--memory", action="store_true", help="report peak memory and top allocation sites")
+    parser.add_argument("--memory-budget-mb", type=float, help="flag solvers whose peak traced memory exceeds this")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to discover, run and summarise every solver
+    """
+    args = parse_args()
+    solvers = discover_solvers(args.years, args.days)
+    if not solvers:
+        print("No solvers found")
+        return
+
+    start = time.perf_counter()
+    options = RunOptions(args.cache, args.profile, args.memory, args.dispatch)
+    results = run_all(solvers, args.workers, options)
+    total_wall = time.perf_counter() - start
+
+    print_summary(results, total_wall, args.output, args.memory_budget_mb)
+
+if __name__ == "__main__":
+    main()
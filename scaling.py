@@ -0,0 +1,367 @@
+"""
+Measure how each solver scales with the size of its input
+
+For every registered study the matching generator from `generate.py` writes inputs of
+growing size, the solver is timed on each one and a power law `time = c * size ** k` is
+fitted on a log-log scale. The exponent `k` shows which hot paths blow up first.
+
+Usage:
+    python scaling.py                     # every study with its default sizes
+    python scaling.py day7 day18
+    python scaling.py day2 --sizes 1000 10000 100000 1000000
+    python scaling.py day2 day7 --record --repeat 3
+    python scaling.py day1 "day1 parallel" --sizes 1000000 100000000
+"""
+import argparse
+import math
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from generate import write_input
+from history import Result, record_run
+from solvers import ROOT, load_module
+
+Solve = Callable[[str], Any]
+STUDIES: dict[str, tuple[Callable[[], Solve], list[int]]] = {}
+
+def register(name: str, sizes: list[int]) -> Callable[[Callable[[], Solve]], Callable[[], Solve]]:
+    """
+    Register a scaling study for a day with its default input sizes
+
+    The decorated factory loads the solver module and returns a function that solves both
+    parts for an input file path
+
+    Args:
+        name (str): The generator name of the day, optionally followed by a label e.g. "day7" or "day1 parallel"
+        sizes (list[int]): The default input sizes to measure
+
+    Returns:
+        Callable[[Callable[[], Solve]], Callable[[], Solve]]: A decorator that registers the study
+    """
+    def decorator(factory: Callable[[], Solve]) -> Callable[[], Solve]:
+        STUDIES[name] = (factory, sizes)
+        return factory
+    return decorator
+
+def solver(name: str) -> Any:
+    """
+    Load a 2015 solver module by its day name e.g. "day7"
+
+    Args:
+        name (str): The day name
+
+    Returns:
+        Any: The imported solver module
+    """
+    return load_module(ROOT / "2015" / f"{name}.py")
+
+@register("day1", [10**5, 10**6, 10**7])
+def day1() -> Solve:
+    """
+    Solve day1 by reading the whole stream into memory
+    """
+    module = solver("day1")
+
+    def solve(path: str) -> Any:
+        with open(path, "r", encoding="utf-8") as file:
+            return module.calculate_floor_and_basement(file.read().strip())
+    return solve
+
+@register("day1 parallel", [10**6, 10**7, 10**8])
+def day1_parallel() -> Solve:
+    """
+    Solve day1 by reducing memory-mapped chunks in worker processes
+    """
+    module = solver("day1")
+    return module.parallel_floor_and_basement
+
+@register("day1 numpy", [10**6, 10**7, 10**8])
+def day1_numpy() -> Solve:
+    """
+    Solve day1 with numpy cumulative sums over bounded blocks
+    """
+    module = solver("day1")
+    return module.numpy_floor_and_basement
+
+@register("day2", [10**4, 10**5, 10**6])
+def day2() -> Solve:
+    """
+    Solve day2 with the per-box functions
+    """
+    module = solver("day2")
+
+    def solve(path: str) -> Any:
+        dimensions = module.get_dimensions(path)
+        paper = sum(module.calculate_wrapping_paper(dim) for dim in dimensions)
+        ribbon = sum(module.calculate_ribbon(dim) for dim in dimensions)
+        return paper, ribbon
+    return solve
+
+@register("day2 numpy", [10**5, 10**6, 10**7])
+def day2_numpy() -> Solve:
+    """
+    Solve day2 with the columnar numpy parser and array totals
+    """
+    module = solver("day2")
+    return lambda path: module.columnar_totals(module.parse_columns(path))
+
+@register("day2 stream", [10**5, 10**6, 10**7])
+def day2_stream() -> Solve:
+    """
+    Solve day2 with the constant-memory block aggregator
+    """
+    module = solver("day2")
+    return lambda path: module.stream_totals(path)[:2]
+
+@register("day3", [10**4, 10**5, 10**6])
+def day3() -> Solve:
+    """
+    Solve day3 for one and two deliverers
+    """
+    module = solver("day3")
+
+    def solve(path: str) -> Any:
+        with open(path, "r", encoding="utf-8") as file:
+            directions = file.read()
+        return module.count_houses(directions), module.count_houses(directions, 2)
+    return solve
+
+@register("day3 numpy", [10**5, 10**6, 10**7])
+def day3_numpy() -> Solve:
+    """
+    Solve day3 for one and two deliverers with packed keys and np.unique
+    """
+    module = solver("day3")
+
+    def solve(path: str) -> Any:
+        with open(path, "r", encoding="utf-8") as file:
+            directions = file.read()
+        return module.numpy_count_houses(directions), module.numpy_count_houses(directions, 2)
+    return solve
+
+@register("day5", [10**3, 10**4, 10**5])
+def day5() -> Solve:
+    """
+    Solve day5 with the loop based rules
+    """
+    module = solver("day5")
+
+    def solve(path: str) -> Any:
+        with open(path, "r", encoding="utf-8") as file:
+            lines = file.readlines()
+        return sum(map(module.is_nice, lines)), sum(map(module.is_nice_two, lines))
+    return solve
+
+@register("day5 numpy", [10**4, 10**5, 10**6])
+def day5_numpy() -> Solve:
+    """
+    Solve day5 with the byte-matrix classifier
+    """
+    module = solver("day5")
+    return module.count_nice_batch
+
+@register("day5 sharded", [10**4, 10**5, 10**6])
+def day5_sharded() -> Solve:
+    """
+    Solve day5 with the regex rules over line-aligned shards in worker processes
+    """
+    module = solver("day5")
+    return lambda path: module.sharded_counts(path, ("is_nice_regex", "is_nice_two_regex"), 1 << 20, report=True)
+
+@register("day6", [100, 1000, 10000])
+def day6() -> Solve:
+    """
+    Solve day6 on the dense 1000x1000 numpy grids
+    """
+    module = solver("day6")
+    return lambda path: module.dense_totals(module.parse_instructions(path))
+
+@register("day6 compressed", [100, 1000, 10000])
+def day6_compressed() -> Solve:
+    """
+    Solve day6 on grids of compressed cells
+    """
+    module = solver("day6")
+    return lambda path: module.compressed_totals(module.parse_instructions(path))
+
+@register("day7", [10**2, 10**3, 10**4])
+def day7() -> Solve:
+    """
+    Solve day7 by evaluating wire "a" with the memoised calculator
+    """
+    module = solver("day7")
+
+    def solve(path: str) -> Any:
+        return module.build_calculator(module.parse_instructions(path))("a")
+    return solve
+
+@register("day9", [6, 8, 10, 12])
+def day9() -> Solve:
+    """
+    Solve day9 with Held-Karp, the brute force search is factorial
+    """
+    module = solver("day9")
+
+    def solve(path: str) -> Any:
+        cities, distances = module.parse_input_file(path)
+        return module.held_karp(cities, distances), module.held_karp(cities, distances, False)
+    return solve
+
+@register("day13", [5, 6, 7, 8])
+def day13() -> Solve:
+    """
+    Solve day13 by trying every seating permutation
+    """
+    module = solver("day13")
+
+    def solve(path: str) -> Any:
+        seating = module.parse_input(path)
+        return module.find_happiness(seating), module.find_happiness(seating, True)
+    return solve
+
+@register("day14", [10, 100, 1000])
+def day14() -> Solve:
+    """
+    Solve day14 by materialising every reindeer's distance per second
+    """
+    module = solver("day14")
+
+    def solve(path: str) -> Any:
+        race_data = module.parse_data(path, 2503)
+        return module.calculate_distance(race_data), module.calculate_max_points(race_data)
+    return solve
+
+@register("day18", [25, 50, 100])
+def day18() -> Solve:
+    """
+    Solve day18 with the pure-Python simulation for 10 steps
+    """
+    module = solver("day18")
+
+    def solve(path: str) -> Any:
+        grid = module.parse_data(path)
+        part1 = module.count_lights_on(module.run_simulation(grid, 10))
+        part2 = module.count_lights_on(module.run_simulation(grid, 10, True))
+        return part1, part2
+    return solve
+
+@register("day19", [10**2, 10**3, 10**4])
+def day19() -> Solve:
+    """
+    Solve day19 with the regex replacement search and the counting formula
+    """
+    module = solver("day19")
+
+    def solve(path: str) -> Any:
+        forward, molecule = module.parse_data2(path)
+        return len(module.distinct_one_step2(forward, molecule)), module.fewest_steps_formula(molecule)
+    return solve
+
+def fit_exponent(sizes: list[int], timings: list[float]) -> float:
+    """
+    Fit `time = c * size ** k` by least squares on a log-log scale
+
+    Args:
+        sizes (list[int]): The input sizes
+        timings (list[float]): The measured times in seconds
+
+    Returns:
+        float: The fitted exponent `k`, or NaN with fewer than two usable points
+    """
+    points = [(math.log(size), math.log(timing)) for size, timing in zip(sizes, timings) if timing > 0]
+    if len(points) < 2:
+        return math.nan
+    xs, ys = zip(*points)
+    slope, _ = statistics.linear_regression(xs, ys)
+    return slope
+
+def run_study(name: str, sizes: list[int], directory: Path, seed: int = 0, repeat: int = 1) -> list[tuple[int, list[float], str]]:
+    """
+    Time a solver on generated inputs of each size
+
+    Args:
+        name (str): The registered study name e.g. "day7"
+        sizes (list[int]): The input sizes to measure
+        directory (Path): Where to write the generated inputs
+        seed (int): The random seed passed to the generator
+        repeat (int): The number of timed solves per size
+
+    Returns:
+        list[tuple[int, list[float], str]]: The size, the time of each solve in seconds (empty on failure) and the answer or error
+    """
+    solve = STUDIES[name][0]()
+    rows: list[tuple[int, list[float], str]] = []
+    generator = name.split()[0]  # Labelled studies share the day's generator
+
+    # One untimed solve on the smallest input pays for lazy imports and other first-call costs
+    warmup = write_input(generator, min(sizes), directory / f"{generator}_warmup.txt", seed)
+    solve(str(warmup))
+    warmup.unlink()
+
+    for size in sizes:
+        path = write_input(generator, size, directory / f"{generator}_{size}.txt", seed)
+        timings: list[float] = []
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                answer = repr(solve(str(path)))
+                timings.append(time.perf_counter() - start)
+        except (RecursionError, MemoryError) as exc:
+            rows.append((size, [], type(exc).__name__))
+            break  # Larger inputs will fail the same way
+        rows.append((size, timings, answer))
+        path.unlink()
+    return rows
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments for the scaling report
+
+    Args:
+        argv (list[str] | None): The arguments to parse, default is `sys.argv[1:]`
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Fit the empirical complexity of each solver")
+    parser.add_argument("days", nargs="*", help="the studies to run, default is all of them")
+    parser.add_argument("--sizes", nargs="*", type=int, help="override the default input sizes")
+    parser.add_argument("--seed", type=int, default=0, help="the random seed for the generators")
+    parser.add_argument("--repeat", type=int, default=1, help="timed solves per size, the median is fitted")
+    parser.add_argument("--record", action="store_true", help="store the timings in the benchmark history")
+    return parser.parse_args(argv)
+
+def main():
+    """
+    Main function to run the scaling studies and print the fitted exponents
+    """
+    args = parse_args()
+    names = args.days or list(STUDIES)
+    results: list[Result] = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names:
+            sizes = args.sizes or STUDIES[name][1]
+            try:
+                rows = run_study(name, sizes, Path(directory), args.seed, args.repeat)
+            except ImportError as exc:
+                print(f"== {name} (skipped: {exc})")
+                continue
+
+            measured = [(size, statistics.median(timings)) for size, timings, _ in rows if timings]
+            exponent = fit_exponent([size for size, _ in measured], [timing for _, timing in measured])
+            print(f"== {name} (time ~ size^{exponent:.2f})")
+            for size, timings, answer in rows:
+                shown = f"{statistics.median(timings):.4f}s" if timings else "failed"
+                print(f"   {size:>12} {shown:>12}  {answer[:40]}")
+            results.extend(Result(f"scaling/{name}", "default", size, timings) for size, timings, _ in rows if timings)
+
+    if args.record and results:
+        print(f"Recorded run {record_run(results)}")
+
+if __name__ == "__main__":
+    main()
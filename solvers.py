@@ -0,0 +1,103 @@
+"""
+Locate, name and import the solver modules of every year directory
+
+Year directories are not valid package names, so the tools share these helpers to find
+`<year>/day<N>.py` files and load them by path.
+"""
+import importlib.util
+import re
+import sys
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent
+SOLVER_PATTERN = re.compile(r"day(\d+)(\w*)\.py")
+
+def solver_name(path: Path) -> str:
+    """
+    Build a short name for a solver file e.g. "2015/day7"
+
+    Args:
+        path (Path): The path to the solver module
+
+    Returns:
+        str: The year directory and module name joined by a slash
+    """
+    return f"{path.parent.name}/{path.stem}"
+
+def solver_sort_key(path: Path) -> tuple[str, int, str]:
+    """
+    Sort solvers by year, then numerically by day, then by variant suffix
+
+    Args:
+        path (Path): The path to the solver module
+
+    Returns:
+        tuple[str, int, str]: The sort key for the solver
+    """
+    match = SOLVER_PATTERN.fullmatch(path.name)
+    assert match, f"Not a solver module: {path}"
+    return path.parent.name, int(match.group(1)), match.group(2)
+
+def discover_solvers(years: list[str] | None = None, days: list[int] | None = None) -> list[Path]:
+    """
+    Find every solver module that defines a `main()` function
+
+    Args:
+        years (list[str] | None): Only include these year directories, default is all of them
+        days (list[int] | None): Only include these day numbers, default is all of them
+
+    Returns:
+        list[Path]: The paths of the matching solver modules in year/day order
+    """
+    solvers: list[Path] = []
+    for year_dir in ROOT.iterdir():
+        if not year_dir.is_dir() or not year_dir.name.isdigit():
+            continue
+        if years and year_dir.name not in years:
+            continue
+        for path in year_dir.glob("day*.py"):
+            match = SOLVER_PATTERN.fullmatch(path.name)
+            if not match or (days and int(match.group(1)) not in days):
+                continue
+            if re.search(r"^def main\(", path.read_text(encoding="utf-8"), re.MULTILINE):
+                solvers.append(path)
+    return sorted(solvers, key=solver_sort_key)
+
+def load_module(path: str | Path) -> ModuleType:
+    """
+    Import a solver module from its file path
+
+    Year directories are not valid package names, so modules are loaded by path and
+    registered under a unique name such as `aoc_2015_day7`
+
+    Args:
+        path (str | Path): The path to the solver module
+
+    Returns:
+        ModuleType: The imported module
+    """
+    path = Path(path).resolve()
+    module_name = f"aoc_{path.parent.name}_{path.stem}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    assert spec and spec.loader, f"Cannot load {path}"
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def resolve_input(path: str | Path, filename: str) -> Path:
+    """
+    Resolve an input filename relative to the directory of a solver module
+
+    Args:
+        path (str | Path): The path to the solver module
+        filename (str): The input filename used by the solver e.g. "day7.txt"
+
+    Returns:
+        Path: The absolute path to the input file
+    """
+    return Path(path).resolve().parent / filename